@@ -0,0 +1,308 @@
+"""
+Message classification and symbol extraction for the chat API
+
+This module is deliberately self-contained and fully type-annotated: it holds
+the CPU-bound hot path (keyword classification plus alias extraction) with no
+FastAPI or service imports, so it can be compiled ahead of time with mypyc or
+Cython as a drop-in replacement without touching the route handlers.
+"""
+
+import functools
+import logging
+import re
+from typing import Dict, NamedTuple, Optional
+
+import ahocorasick
+import pygtrie
+
+# Optional SIMD-accelerated matcher; the Aho-Corasick automaton is the fallback
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+# Keyword lists per query category, shared by the single Aho-Corasick automaton below
+CATEGORY_KEYWORDS = {
+    "investment": (
+        "invest", "investment", "suggest", "recommend", "portfolio",
+        "stock", "crypto", "cryptocurrency", "market", "trading",
+        "buy", "sell", "hold", "analysis", "analyze", "research",
+        "fund", "mutual fund", "etf", "index", "market cap", "volume"
+    ),
+    "price": (
+        "price", "cost", "worth", "value", "current", "rate",
+        "quote", "trading", "market", "stock", "crypto", "cryptocurrency",
+        "volume", "market cap", "cap", "high", "low", "open", "close"
+    ),
+    "etf": (
+        "etf", "etfs", "exchange traded fund", "exchange-traded fund",
+        "index fund", "what are etfs", "tell me about etfs", "explain etfs"
+    ),
+    "gold": (
+        "gold", "golden", "precious metal", "bullion", "gold etf",
+        "gold investment", "gold price", "gold fund"
+    ),
+    "mutual_fund": (
+        "mutual fund", "mutual funds", "mf", "sip", "systematic investment",
+        "active fund", "passive fund", "fund manager"
+    ),
+    "definition": (
+        "what is", "what are", "explain", "definition", "define", "tell me about",
+        "describe", "how does", "meaning of", "tell me what"
+    )
+}
+
+# One bit per category: a classification result is a single int, checked by
+# consumers with `flags & FLAG_*`, and each automaton match ORs its mask in
+FLAG_INVESTMENT = 1
+FLAG_PRICE = 2
+FLAG_ETF = 4
+FLAG_GOLD = 8
+FLAG_MUTUAL_FUND = 16
+FLAG_DEFINITION = 32
+
+CATEGORY_FLAGS = {
+    "investment": FLAG_INVESTMENT,
+    "price": FLAG_PRICE,
+    "etf": FLAG_ETF,
+    "gold": FLAG_GOLD,
+    "mutual_fund": FLAG_MUTUAL_FUND,
+    "definition": FLAG_DEFINITION
+}
+
+_ALL_FLAGS = FLAG_INVESTMENT | FLAG_PRICE | FLAG_ETF | FLAG_GOLD | FLAG_MUTUAL_FUND | FLAG_DEFINITION
+
+def _keyword_masks() -> Dict[str, int]:
+    """Map every keyword to the OR of the category bits it belongs to"""
+    keyword_masks: Dict[str, int] = {}
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_masks[keyword] = keyword_masks.get(keyword, 0) | CATEGORY_FLAGS[category]
+    return keyword_masks
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Build a single automaton mapping every keyword to its category bitmask"""
+    automaton = ahocorasick.Automaton()
+    for keyword, mask in _keyword_masks().items():
+        automaton.add_word(keyword, mask)
+    automaton.make_automaton()
+    return automaton
+
+# Built once at import time so every request shares the same compiled automaton
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _build_hyperscan_database():
+    """
+    Compile the keyword set into a Hyperscan database when the optional
+    dependency is installed
+
+    Returns:
+        Tuple of (database, id->bitmask list), or (None, None) when
+        Hyperscan is unavailable or compilation fails
+    """
+    if hyperscan is None:
+        return None, None
+    try:
+        keyword_masks = _keyword_masks()
+        id_masks = list(keyword_masks.values())
+        expressions = [re.escape(keyword).encode() for keyword in keyword_masks]
+        db = hyperscan.Database()
+        db.compile(expressions=expressions, ids=list(range(len(expressions))))
+        return db, id_masks
+    except Exception as e:
+        logger.warning("Hyperscan unavailable, falling back to Aho-Corasick: %s", e)
+        return None, None
+
+_HYPERSCAN_DB, _HYPERSCAN_ID_MASKS = _build_hyperscan_database()
+
+def classify_message(message: str, message_lower: Optional[str] = None) -> int:
+    """
+    Classify a message into all query categories with a single scan
+
+    Lowercases the message once (or reuses a caller-provided lowered copy)
+    and walks the shared Aho-Corasick automaton, ORing in the category bits
+    of every keyword that appears in the message. Callers that need several
+    of the is_*_query answers should call this once and test bits with the
+    FLAG_* constants instead of re-scanning per category.
+
+    Args:
+        message: Raw user message
+        message_lower: Optional pre-lowercased message to avoid re-lowercasing
+
+    Returns:
+        Bitmask of FLAG_* category bits
+    """
+    if message_lower is None:
+        message_lower = message.lower()
+    return _classify_lower(message_lower)
+
+@functools.lru_cache(maxsize=4096)
+def _classify_lower(message_lower: str) -> int:
+    """Scan a lowercased message; memoized since classification is pure"""
+    mask = 0
+    if _HYPERSCAN_DB is not None:
+        matched_ids = []
+        def _on_match(match_id, start, end, flags, context):
+            matched_ids.append(match_id)
+        _HYPERSCAN_DB.scan(message_lower.encode(), match_event_handler=_on_match)
+        for match_id in matched_ids:
+            mask |= _HYPERSCAN_ID_MASKS[match_id]
+    else:
+        for _, keyword_mask in KEYWORD_AUTOMATON.iter(message_lower):
+            mask |= keyword_mask
+            if mask == _ALL_FLAGS:
+                break
+    return mask
+
+def is_investment_suggestion_query(message: str) -> bool:
+    """Check if the message is asking for investment suggestions"""
+    return bool(classify_message(message) & FLAG_INVESTMENT)
+
+def is_price_query(message: str) -> bool:
+    """Check if the message is asking for price information"""
+    return bool(classify_message(message) & FLAG_PRICE)
+
+def is_etf_query(message: str) -> bool:
+    """Check if the message is asking about ETFs"""
+    return bool(classify_message(message) & FLAG_ETF)
+
+def is_gold_query(message: str) -> bool:
+    """Check if the message is asking about gold investments"""
+    return bool(classify_message(message) & FLAG_GOLD)
+
+def is_mutual_fund_query(message: str) -> bool:
+    """Check if the message is asking about mutual funds"""
+    return bool(classify_message(message) & FLAG_MUTUAL_FUND)
+
+def is_definition_query(message: str) -> bool:
+    """Check if the message is asking for a definition or explanation"""
+    return bool(classify_message(message) & FLAG_DEFINITION)
+
+CRYPTO_SYMBOL_MAPPING = {
+    "bitcoin": "BTC",
+    "ethereum": "ETH",
+    "litecoin": "LTC",
+    "bitcoin cash": "BCH",
+    "cardano": "ADA",
+    "polkadot": "DOT",
+    "ripple": "XRP",
+    "dogecoin": "DOGE",
+    "solana": "SOL",
+    "polygon": "MATIC",
+    "chainlink": "LINK",
+    "avalanche": "AVAX",
+    "uniswap": "UNI",
+    "tether": "USDT",
+    "usd coin": "USDC",
+    "shiba inu": "SHIB",
+    "wrapped bitcoin": "WBTC",
+    "cosmos": "ATOM",
+    "near protocol": "NEAR"
+}
+
+STOCK_SYMBOL_MAPPING = {
+    "reliance": "RELIANCE.NS",
+    "tcs": "TCS.NS",
+    "hdfc": "HDFCBANK.NS",
+    "infosys": "INFY.NS",
+    "icici": "ICICIBANK.NS",
+    "sbi": "SBIN.NS",
+    "hul": "HINDUNILVR.NS",
+    "itc": "ITC.NS",
+    "bharti": "BHARTIARTL.NS",
+    "kotak": "KOTAKBANK.NS",
+    "axis": "AXISBANK.NS",
+    "wipro": "WIPRO.NS",
+    "asian paints": "ASIANPAINT.NS",
+    "bajaj finance": "BAJFINANCE.NS",
+    "hdfc life": "HDFCLIFE.NS",
+    "titan": "TITAN.NS",
+    "nestle": "NESTLEIND.NS",
+    "maruti": "MARUTI.NS",
+    "tata steel": "TATASTEEL.NS",
+    "ultracemco": "ULTRACEMCO.NS"
+}
+
+def _build_symbol_trie(symbol_mapping: Dict[str, str]) -> pygtrie.CharTrie:
+    """
+    Build a character trie keyed on alias with the canonical symbol as value
+
+    Every name and symbol becomes a trie key, so extraction is one O(m)
+    longest-prefix walk per word start instead of dozens of substring scans,
+    and overlapping aliases like "hdfc" vs "hdfc life" resolve to the longest
+    match rather than whichever the dict happened to list first.
+    """
+    trie = pygtrie.CharTrie()
+    for name, symbol in symbol_mapping.items():
+        trie[name] = symbol
+        trie.setdefault(symbol.lower(), symbol)
+    return trie
+
+_CRYPTO_TRIE = _build_symbol_trie(CRYPTO_SYMBOL_MAPPING)
+_STOCK_TRIE = _build_symbol_trie(STOCK_SYMBOL_MAPPING)
+
+# First characters of every alias in each trie: a position whose character
+# cannot start any alias is rejected with one set test instead of a trie walk,
+# which skips the prefix scan entirely for most words in a typical message
+_CRYPTO_ALIAS_STARTS = frozenset(key[0] for key in _CRYPTO_TRIE)
+_STOCK_ALIAS_STARTS = frozenset(key[0] for key in _STOCK_TRIE)
+
+# Candidate word starts in a lowercased message. Driving the scan from this
+# pattern's matches keeps the per-character advance inside the C regex engine
+# instead of a Python loop over every index, which is what dominates on long
+# pasted messages
+_WORD_START_PATTERN = re.compile(r"[a-z0-9]+")
+
+def _scan_symbol_trie(trie: pygtrie.CharTrie, alias_starts: frozenset, message_lower: str) -> Optional[str]:
+    """Return the symbol for the leftmost longest word-bounded alias in message_lower"""
+    length = len(message_lower)
+    for word in _WORD_START_PATTERN.finditer(message_lower):
+        i = word.start()
+        # Only start matching at word boundaries, and only where the first
+        # character could begin an alias at all
+        if i > 0 and message_lower[i - 1].isalnum():
+            continue
+        if message_lower[i] not in alias_starts:
+            continue
+        best = None
+        for key, symbol in trie.prefixes(message_lower[i:]):
+            end = i + len(key)
+            # Reject matches that stop mid-word, e.g. "itc" inside "pitch"
+            if end == length or not message_lower[end].isalnum():
+                best = symbol
+        if best is not None:
+            return best
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def extract_crypto_symbol(message_lower: str) -> Optional[str]:
+    """Extract cryptocurrency symbol from a pre-lowercased message"""
+    return _scan_symbol_trie(_CRYPTO_TRIE, _CRYPTO_ALIAS_STARTS, message_lower)
+
+@functools.lru_cache(maxsize=4096)
+def extract_stock_symbol(message_lower: str) -> Optional[str]:
+    """Extract stock symbol from a pre-lowercased message"""
+    return _scan_symbol_trie(_STOCK_TRIE, _STOCK_ALIAS_STARTS, message_lower)
+
+class Classification(NamedTuple):
+    """Everything the chat route needs to know about one message"""
+    flags: int
+    crypto_symbol: Optional[str]
+    stock_symbol: Optional[str]
+
+@functools.lru_cache(maxsize=4096)
+def classify(message_lower: str) -> Classification:
+    """
+    Run the full classification stack once for a pre-lowercased message
+
+    Bundles the category bitmask and both symbol extractions into a single
+    memoized result, so a repeated message costs one cache hit instead of
+    three separate lookups keyed on the same string.
+    """
+    return Classification(
+        flags=_classify_lower(message_lower),
+        crypto_symbol=_scan_symbol_trie(_CRYPTO_TRIE, _CRYPTO_ALIAS_STARTS, message_lower),
+        stock_symbol=_scan_symbol_trie(_STOCK_TRIE, _STOCK_ALIAS_STARTS, message_lower)
+    )
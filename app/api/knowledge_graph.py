@@ -1,34 +1,98 @@
-from fastapi import APIRouter, HTTPException, status, Query
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import logging
+
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Request, Response, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.knowledge_graph.manager import KnowledgeGraphManager
+from app.utils.api.crypto.coingecko import CoinGeckoClient
+
+logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Graph payloads can be large; orjson serializes them without the pure-Python
+# dict walk of the default encoder
+router = APIRouter(default_response_class=ORJSONResponse)
 kg_manager = KnowledgeGraphManager()
 
+def _populate_kg() -> None:
+    """Populate the graph from the CoinGecko funded-projects catalog"""
+    crypto_data = CoinGeckoClient().funded_projects
+    kg_manager.populate_from_crypto_data(crypto_data)
+    logger.info("Knowledge graph primed with %s projects", len(crypto_data))
+
+async def prime_knowledge_graph() -> None:
+    """
+    Populate the knowledge graph off the critical path
+
+    Runs in a worker thread from a background task at startup, so workers
+    begin serving requests while the graph fills in.
+    """
+    await asyncio.to_thread(_populate_kg)
+
+# Concepts and categories change only when the graph is repopulated, so each
+# route serializes and hashes its payload once per graph version and answers
+# repeat requests with either the cached bytes or a bodyless 304
+_CACHE_CONTROL = "max-age=60"
+_etag_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+def _conditional_json(request: Request, key: Tuple, payload_fn: Callable[[], Any]) -> Response:
+    """Serve a payload with ETag support, recomputing only when the graph changes"""
+    version = kg_manager.data_version
+    cached = _etag_cache.get(key)
+    if cached is None or cached[0] != version:
+        body = orjson.dumps(payload_fn())
+        etag = f'"{hashlib.blake2b(body).hexdigest()}"'
+        cached = (version, etag, body)
+        _etag_cache[key] = cached
+    _, etag, body = cached
+
+    headers = {"etag": etag, "cache-control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# Shared v2 config: unknown keys are dropped instead of failing, and frozen
+# instances skip the per-field assignment machinery
+_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
 class EntityResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     id: str
     type: str
     properties: Dict[str, Any]
     relationships: List[Dict[str, Any]]
 
 class QueryRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+
     query: str
     filters: Optional[Dict[str, Any]] = None
     limit: int = 10
 
 class QueryResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     results: List[Dict[str, Any]]
     count: int
     query_info: Dict[str, Any]
 
 class CategoryInfo(BaseModel):
+    model_config = _MODEL_CONFIG
+
     name: str
     count: int
     description: Optional[str] = None
 
-@router.get("/entity/{entity_id}", response_model=EntityResponse)
+# response_model would re-validate and copy every relationship dict on each
+# request; the manager already returns a JSON-ready dict, so the models are
+# kept only for the OpenAPI schema
+@router.get("/entity/{entity_id}", responses={200: {"model": EntityResponse}})
 async def get_entity(entity_id: str):
     """
     Get detailed information about a specific financial entity
@@ -47,7 +111,7 @@ async def get_entity(entity_id: str):
             detail=f"Error retrieving entity: {str(e)}"
         )
 
-@router.post("/query", response_model=QueryResponse)
+@router.post("/query", responses={200: {"model": QueryResponse}})
 async def query_graph(request: QueryRequest):
     """
     Query the financial knowledge graph with natural language
@@ -58,20 +122,22 @@ async def query_graph(request: QueryRequest):
             filters=request.filters,
             limit=request.limit
         )
-        
-        return QueryResponse(
-            results=results.get("results", []),
-            count=len(results.get("results", [])),
-            query_info=results.get("query_info", {})
-        )
+
+        result_list = results.get("results", [])
+        return {
+            "results": result_list,
+            "count": len(result_list),
+            "query_info": results.get("query_info", {})
+        }
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error querying knowledge graph: {str(e)}"
         )
 
-@router.get("/concepts", response_model=List[Dict[str, Any]])
+@router.get("/concepts", responses={200: {"model": List[Dict[str, Any]]}})
 async def get_concepts(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by concept category"),
     limit: int = Query(20, description="Maximum number of concepts to return")
 ):
@@ -79,22 +145,28 @@ async def get_concepts(
     Get top-level financial concepts from the knowledge graph
     """
     try:
-        concepts = kg_manager.get_concepts(category=category, limit=limit)
-        return concepts
+        return _conditional_json(
+            request,
+            ("concepts", category, limit),
+            lambda: kg_manager.get_concepts(category=category, limit=limit)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving concepts: {str(e)}"
         )
 
-@router.get("/categories", response_model=Dict[str, List[CategoryInfo]])
-async def get_categories():
+@router.get("/categories", responses={200: {"model": Dict[str, List[CategoryInfo]]}})
+async def get_categories(request: Request):
     """
     Get all available categories in the knowledge graph with counts
     """
     try:
-        categories_with_counts = kg_manager.get_categories_with_counts()
-        return {"categories": categories_with_counts}
+        return _conditional_json(
+            request,
+            ("categories",),
+            lambda: {"categories": kg_manager.get_categories_with_counts()}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -3,9 +3,14 @@ from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 import os
+from collections import defaultdict, deque
 from typing import List, Dict, Any, Optional
 import json
 
+# Bounded history per user: a full deque drops its oldest message on append,
+# so long-running sessions hold a fixed amount of memory
+MAX_HISTORY_MESSAGES = 200
+
 # Templates directory
 templates_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "templates")
 os.makedirs(templates_dir, exist_ok=True)
@@ -22,8 +27,8 @@ class ChatInterface:
         # Set up routes
         self.setup_routes()
         
-        # Create chat history storage (in-memory for demo)
-        self.chat_history = {}
+        # Create chat history storage (in-memory for demo), bounded per user
+        self.chat_history = defaultdict(lambda: deque(maxlen=MAX_HISTORY_MESSAGES))
     
     def setup_routes(self):
         """Set up the routes for the chat interface"""
@@ -41,10 +46,13 @@ class ChatInterface:
         @self.app.get("/api/chat/history")
         async def get_chat_history(request: Request, user_id: str = "anonymous"):
             """Get the chat history for a user"""
-            return {"history": self.chat_history.get(user_id, [])}
+            # Tuple default avoids creating an empty deque for unknown users
+            return {"history": list(self.chat_history.get(user_id, ()))}
         
         @self.app.post("/api/chat/clear")
         async def clear_chat_history(request: Request, user_id: str = Form(default="anonymous")):
             """Clear the chat history for a user"""
-            self.chat_history[user_id] = []
+            # Clear in place so the existing buffer is reused instead of
+            # leaving the old list for the garbage collector
+            self.chat_history[user_id].clear()
             return {"status": "success", "message": "Chat history cleared"} 
\ No newline at end of file
@@ -1,10 +1,26 @@
 import os
 import json
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class RelationshipRecord:
+    """
+    One directed edge as seen from a node
+
+    Slots keep the per-edge footprint to four references instead of a
+    dict, which adds up across the adjacency indexes.
+    """
+    source: str
+    target: str
+    relationship_type: str
+    properties: Dict[str, Any]
+
 class KnowledgeGraphManager:
     """
     Manager class for the finance domain knowledge graph
@@ -16,6 +32,25 @@ class KnowledgeGraphManager:
         # Initialize the graph
         self._load_mock_data()
         self.logger = logging.getLogger(__name__)
+        # Monotonic counter bumped on every mutation; gives caching layers a
+        # cheap way to tell whether the graph has changed since a snapshot
+        self.data_version = 0
+        # Adjacency index: ready-made outgoing relationship records per
+        # source node, so traversals read O(deg) prebuilt dicts instead of
+        # scanning the whole entity store
+        self._outgoing = defaultdict(list)
+        # Reverse index mirroring _outgoing: incoming records per target
+        # node, maintained incrementally so reverse traversal is O(deg) too
+        self._incoming = defaultdict(list)
+        # symbol -> node name, so ticker lookups are a dict get instead of a
+        # scan over every entity's properties
+        self._symbol_index = {}
+        # category -> member node names, so same-category neighbours are a
+        # bucket read instead of materializing pairwise edges
+        self._category_members = defaultdict(list)
+        # Inverted index over node categories, so category-filtered queries
+        # touch only in-category nodes instead of scanning every entity
+        self._entities_by_category = defaultdict(list)
     
     def _load_mock_data(self):
         """Load mock data for development"""
@@ -30,7 +65,19 @@ class KnowledgeGraphManager:
                 "risk": ["types", "assessment", "management", "mitigation", "insurance"]
             }
         }
-    
+
+        # The mock categories are fixed at construction, so both category
+        # views are computed once here instead of being rebuilt per request
+        self._category_names_cached = tuple(self.mock_data["categories"].keys())
+        self._categories_with_counts_cached = [
+            {
+                "name": category,
+                "count": len(subcategories),
+                "description": f"Financial information related to {category.replace('_', ' ')}"
+            }
+            for category, subcategories in self.mock_data["categories"].items()
+        ]
+
     def add_node(self, name: str, node_type: str, properties: Dict[str, Any] = None):
         """
         Add a node to the knowledge graph
@@ -40,22 +87,27 @@ class KnowledgeGraphManager:
             node_type: Type of the node
             properties: Node properties
         """
-        try:
-            if name not in self.mock_data["entities"]:
-                self.mock_data["entities"][name] = {
-                    "type": node_type,
-                    "properties": properties or {}
-                }
-            else:
-                # Update existing node
-                self.mock_data["entities"][name]["type"] = node_type
-                if properties:
-                    self.mock_data["entities"][name]["properties"].update(properties)
-            
-            return True
-        except Exception as e:
-            self.logger.error(f"Error adding node: {str(e)}")
-            return False
+        # Every operation here touches dicts the manager owns; no try/except
+        # so the mutators stay exception-free on the populate hot path.
+        # setdefault upserts with one entity lookup, and pre-materializing
+        # the relationships list spares add_relationship its presence check.
+        entity = self.mock_data["entities"].setdefault(
+            name, {"type": node_type, "properties": {}, "relationships": []}
+        )
+        entity["type"] = node_type
+        if properties:
+            entity["properties"].update(properties)
+
+        if properties and "symbol" in properties:
+            self._symbol_index[properties["symbol"]] = name
+
+        if properties and "category" in properties:
+            bucket = self._entities_by_category[properties["category"]]
+            if name not in bucket:
+                bucket.append(name)
+
+        self.data_version += 1
+        return True
     
     def add_relationship(self, source: str, target: str, relationship_type: str, properties: Dict[str, Any] = None):
         """
@@ -67,30 +119,39 @@ class KnowledgeGraphManager:
             relationship_type: Type of relationship
             properties: Relationship properties
         """
-        try:
-            # Make sure both nodes exist
-            if source not in self.mock_data["entities"]:
-                self.add_node(source, "Unknown")
-            
-            if target not in self.mock_data["entities"]:
-                self.add_node(target, "Unknown")
-            
-            # Add relationship to source node
-            if "relationships" not in self.mock_data["entities"][source]:
-                self.mock_data["entities"][source]["relationships"] = []
-            
-            # Add relationship with properties
-            relationship = {
-                "target": target,
-                "type": relationship_type,
-                "properties": properties or {}
-            }
-            
-            self.mock_data["entities"][source]["relationships"].append(relationship)
-            return True
-        except Exception as e:
-            self.logger.error(f"Error adding relationship: {str(e)}")
-            return False
+        # The handful of relationship types recur across every edge;
+        # interning makes each edge reference one shared string instead
+        # of carrying its own copy
+        relationship_type = sys.intern(relationship_type)
+
+        # Make sure both nodes exist; add_node pre-materializes the
+        # relationships list, so no presence check is needed here
+        if source not in self.mock_data["entities"]:
+            self.add_node(source, "Unknown")
+
+        if target not in self.mock_data["entities"]:
+            self.add_node(target, "Unknown")
+
+        # Add relationship with properties
+        relationship = {
+            "target": target,
+            "type": relationship_type,
+            "properties": properties or {}
+        }
+        
+        self.mock_data["entities"][source]["relationships"].append(relationship)
+
+        # Index the edge once at insert time; the record shares the
+        # properties dict with the node entry rather than copying it
+        self._outgoing[source].append(RelationshipRecord(
+            source, target, relationship_type, relationship["properties"]
+        ))
+        self._incoming[target].append(RelationshipRecord(
+            source, target, f"INVERSE_{relationship_type}", relationship["properties"]
+        ))
+
+        self.data_version += 1
+        return True
     
     def get_entity(self, entity_id: str) -> Dict[str, Any]:
         """
@@ -103,11 +164,21 @@ class KnowledgeGraphManager:
             Entity data including properties and relationships
         """
         # In a real implementation, this would query the graph database
-        entities = self.mock_data.get("entities", {})
-        if entity_id in entities:
-            return entities[entity_id]
-        return None
+        return self.mock_data["entities"].get(entity_id)
     
+    def get_entities(self, ids) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several entities in one call
+
+        Args:
+            ids: Iterable of entity identifiers
+
+        Returns:
+            Mapping of the identifiers that exist to their entity data
+        """
+        entities = self.mock_data.get("entities", {})
+        return {entity_id: entities[entity_id] for entity_id in ids if entity_id in entities}
+
     def query(self, query: str, filters: Optional[Dict[str, Any]] = None, limit: int = 10) -> Dict[str, Any]:
         """
         Query the knowledge graph with natural language
@@ -120,31 +191,37 @@ class KnowledgeGraphManager:
         Returns:
             Results and query metadata
         """
-        # Mock implementation
         results = []
-        concepts = self.mock_data.get("concepts", [])
-        
-        # Apply filters if provided
+
+        # Category filters are pushed into the inverted index, so only
+        # in-category nodes are ever materialized and the walk stops as
+        # soon as the limit is reached
         if filters and "category" in filters:
-            categories = filters.get("category", [])
-            if categories:
-                return {
-                    "results": [],
-                    "query_info": {
-                        "original_query": query,
-                        "filters_applied": filters if filters else {},
-                        "total_matches": 0,
-                        "returned": 0
-                    }
-                }
-        
+            wanted = filters.get("category", [])
+            if isinstance(wanted, str):
+                wanted = [wanted]
+
+            entities = self.mock_data["entities"]
+            for category in wanted:
+                for name in self._entities_by_category.get(category, ()):
+                    entity = entities[name]
+                    results.append({
+                        "id": name,
+                        "properties": entity.get("properties", {}),
+                        "relationships": entity.get("relationships", [])
+                    })
+                    if len(results) >= limit:
+                        break
+                if len(results) >= limit:
+                    break
+
         return {
-            "results": [],
+            "results": results,
             "query_info": {
                 "original_query": query,
                 "filters_applied": filters if filters else {},
-                "total_matches": 0,
-                "returned": 0
+                "total_matches": len(results),
+                "returned": len(results)
             }
         }
     
@@ -168,23 +245,13 @@ class KnowledgeGraphManager:
         Returns:
             List of category names
         """
-        return list(self.mock_data.get("categories", {}).keys())
-    
+        return list(self._category_names_cached)
+
     def get_categories_with_counts(self) -> List[Dict[str, Any]]:
         """Get all available categories in the knowledge graph with counts"""
-        categories = self.mock_data.get("categories", {})
-        result = []
-        
-        for category, subcategories in categories.items():
-            # In a real implementation, this would query the actual count from the database
-            # For mock data, we'll use the number of subcategories as the count
-            result.append({
-                "name": category,
-                "count": len(subcategories),
-                "description": f"Financial information related to {category.replace('_', ' ')}"
-            })
-            
-        return result
+        # In a real implementation, this would query the actual count from
+        # the database; for mock data the list was built in _load_mock_data
+        return self._categories_with_counts_cached
 
     def get_graph_enhanced_context(self, query, vector_results):
         """
@@ -207,29 +274,36 @@ class KnowledgeGraphManager:
                 if 'name' in metadata:
                     entities.add(metadata['name'])
             
-            # Get graph context
-            graph_context = ""
+            # Get graph context; parts are joined once instead of growing a
+            # string with += inside the loops. The loop is skipped outright
+            # when the top-k results carried no entities — the common case
+            # pays nothing for the graph pass.
+            graph_parts = []
             for entity in entities:
-                # Get node properties
+                # Get node properties; unknown entities are skipped before
+                # any relationship work
                 node = self.get_node_by_name(entity)
-                if node:
-                    graph_context += f"Information about {node.get('name', entity)}:\n"
-                    
-                    for prop, value in node.get('properties', {}).items():
-                        if prop not in ['name'] and value:
-                            graph_context += f"- {prop}: {value}\n"
-                    
-                    # Get relationships
-                    relationships = self.get_relationships(entity)
-                    if relationships:
-                        graph_context += "Relationships:\n"
-                        for rel in relationships:
-                            graph_context += f"- {rel.get('relationship_type', '')} {rel.get('target', '')}\n"
-                    
-                    graph_context += "\n"
+                if node is None:
+                    continue
+
+                graph_parts.append(f"Information about {node.get('name', entity)}:\n")
+
+                for prop, value in node.get('properties', {}).items():
+                    if prop != 'name' and value:
+                        graph_parts.append(f"- {prop}: {value}\n")
+
+                # Get relationships; traverse resolves ticker symbols to
+                # node names before reading the adjacency buckets
+                relationships = self.traverse(entity, max_depth=1)
+                if relationships:
+                    graph_parts.append("Relationships:\n")
+                    for rel in relationships:
+                        graph_parts.append(f"- {rel.relationship_type} {rel.target}\n")
+
+                graph_parts.append("\n")
             
             # Combine with vector results
-            combined_context = "Relevant information:\n\n"
+            combined_parts = ["Relevant information:\n\n"]
             for i, result in enumerate(vector_results, 1):
                 text = result.get('text', '')
                 metadata = result.get('metadata', {})
@@ -237,18 +311,19 @@ class KnowledgeGraphManager:
                 name = metadata.get('name', symbol)
                 
                 if name and text:
-                    combined_context += f"{i}. {name} ({symbol}): {text}\n\n"
+                    combined_parts.append(f"{i}. {name} ({symbol}): {text}\n\n")
                 elif text:
-                    combined_context += f"{i}. {text}\n\n"
+                    combined_parts.append(f"{i}. {text}\n\n")
             
             # Add graph knowledge
-            if graph_context:
-                combined_context += "\nAdditional knowledge graph information:\n\n" + graph_context
+            if graph_parts:
+                combined_parts.append("\nAdditional knowledge graph information:\n\n")
+                combined_parts.extend(graph_parts)
             
-            return combined_context
+            return "".join(combined_parts)
         
         except Exception as e:
-            self.logger.error(f"Error generating graph-enhanced context: {str(e)}")
+            self.logger.error("Error generating graph-enhanced context: %s", e)
             return ""
 
     def get_node_by_name(self, name):
@@ -261,21 +336,19 @@ class KnowledgeGraphManager:
         Returns:
             Node properties or None if not found
         """
-        try:
-            # Search for the node in the graph
-            node = self.mock_data.get("entities", {}).get(name)
-            if node:
-                return node
-            
-            # Try searching as a property
-            for node_name, props in self.mock_data.get("entities", {}).items():
-                if props.get('properties', {}).get('symbol') == name:
-                    return {**props, 'name': node_name}
-            
-            return None
-        except Exception as e:
-            self.logger.error(f"Error getting node by name: {str(e)}")
-            return None
+        # Pure dict gets with a None sentinel; no try/except so misses on
+        # the traversal hot path cost nothing
+        node = self.mock_data["entities"].get(name)
+        if node:
+            return node
+
+        # Fall back to the symbol index kept up to date by add_node; a
+        # dict get replaces the old scan over every entity's properties
+        node_name = self._symbol_index.get(name)
+        if node_name is not None:
+            return {**self.mock_data["entities"][node_name], 'name': node_name}
+
+        return None
 
     def get_relationships(self, node_name):
         """
@@ -287,34 +360,88 @@ class KnowledgeGraphManager:
         Returns:
             List of relationships
         """
-        try:
-            relationships = []
-            
-            # Get outgoing relationships
-            for source, target, props in self.mock_data.get("entities", {}).items():
-                if source == node_name:
-                    relationships.append({
-                        'source': source,
-                        'target': target,
-                        'relationship_type': props.get('properties', {}).get('type', 'RELATED_TO'),
-                        'properties': props.get('properties', {})
-                    })
-            
-            # Get incoming relationships
-            for source, target, props in self.mock_data.get("entities", {}).items():
-                if target == node_name:
-                    relationships.append({
-                        'source': source,
-                        'target': target,
-                        'relationship_type': f"INVERSE_{props.get('properties', {}).get('type', 'RELATED_TO')}",
-                        'properties': props.get('properties', {})
-                    })
-            
-            return relationships
-        except Exception as e:
-            self.logger.error(f"Error getting relationships: {str(e)}")
+        # Both directions come straight from the adjacency indexes built
+        # in add_relationship: O(deg) prebuilt records instead of the old
+        # full-entity scan, which unpacked dict keys into three values
+        # and never produced a result. Misses fall through the dict gets
+        # without raising, so no try/except is needed here.
+        outgoing = self._outgoing.get(node_name)
+        incoming = self._incoming.get(node_name)
+        if outgoing and incoming:
+            return outgoing + incoming
+        return list(outgoing or incoming or ())
+
+    def traverse(self, root, max_depth=1, rel_types=None):
+        """
+        Collect the relationship records reachable from a node
+
+        Args:
+            root: Node name or ticker symbol to start from
+            max_depth: How many hops to expand
+            rel_types: Optional set of relationship types to follow
+
+        Returns:
+            List of relationship records within max_depth hops of the root
+        """
+        node = self.get_node_by_name(root)
+        if node is None or max_depth < 1:
             return []
 
+        # Iterative DFS over the adjacency indexes; the visited set makes
+        # each node expand exactly once, so every hop is a single prebuilt
+        # bucket read with no repeated sub-path work
+        root_name = node.get('name', root)
+        results = []
+        visited = {root_name}
+        stack = [(root_name, max_depth)]
+        while stack:
+            name, depth = stack.pop()
+            for record in self.get_relationships(name):
+                if rel_types is not None and record.relationship_type not in rel_types:
+                    continue
+                results.append(record)
+                if depth > 1:
+                    # The neighbour is whichever end of the edge is not the
+                    # node being expanded
+                    neighbor = record.source if record.target == name else record.target
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        stack.append((neighbor, depth - 1))
+        return results
+
+    def siblings_in_category(self, category):
+        """
+        Get names of all members of a category
+
+        Args:
+            category: Category name
+
+        Returns:
+            List of member node names, empty for an unknown category
+        """
+        # Bucket read from the index maintained at populate time; no scan
+        # over entity properties
+        return self._category_members.get(category, [])
+
+    def get_siblings_in_category(self, name):
+        """
+        Get names of the other nodes sharing a node's category
+
+        Args:
+            name: Node name or ticker symbol
+
+        Returns:
+            List of sibling node names, empty if the node or its category
+            is unknown
+        """
+        node = self.get_node_by_name(name)
+        if not node:
+            return []
+
+        node_name = node.get('name', name)
+        category = node.get('properties', {}).get('category')
+        return [member for member in self.siblings_in_category(category) if member != node_name]
+
     def populate_from_crypto_data(self, crypto_data):
         """
         Populate the knowledge graph with cryptocurrency data
@@ -326,7 +453,10 @@ class KnowledgeGraphManager:
             # Add crypto entities and relationships
             for symbol, data in crypto_data.items():
                 name = data.get('name', symbol)
-                category = data.get('category', 'Unknown')
+                # Categories repeat across projects; intern so node
+                # properties, BELONGS_TO targets and bucket keys share one
+                # string object per category
+                category = sys.intern(data.get('category', 'Unknown'))
                 description = data.get('description', '')
                 
                 # Add the node
@@ -342,24 +472,18 @@ class KnowledgeGraphManager:
                     }
                 )
                 
-                # Add category relationship
+                # Add category relationship and record the membership; the
+                # old inner loop materialized O(N^2) pairwise RELATED_TO
+                # edges that only restated "same category" — siblings are now
+                # answered from the bucket on demand
                 self.add_relationship(
                     source=name,
                     target=category,
                     relationship_type="BELONGS_TO"
                 )
-                
-                # Add relationships between projects of the same category
-                for other_symbol, other_data in crypto_data.items():
-                    if symbol != other_symbol and other_data.get('category') == category:
-                        self.add_relationship(
-                            source=name,
-                            target=other_data.get('name', other_symbol),
-                            relationship_type="RELATED_TO",
-                            properties={"relationship": "Same category"}
-                        )
-            
+                self._category_members[category].append(name)
+
             return True
         except Exception as e:
-            self.logger.error(f"Error populating knowledge graph with crypto data: {str(e)}")
+            self.logger.error("Error populating knowledge graph with crypto data: %s", e)
             return False 
\ No newline at end of file
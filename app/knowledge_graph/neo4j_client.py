@@ -24,10 +24,30 @@ class Neo4jClient:
         Returns:
             List of query results as dictionaries
         """
-        logger.debug(f"Mock query executed: {cypher_query}")
+        logger.debug("Mock query executed: %s", cypher_query)
         # Return empty results for all queries
         return []
-    
+
+    def traverse(self, root: str, max_depth: int = 1, rel_types: Optional[set] = None) -> List[Dict[str, Any]]:
+        """
+        Collect the relationship records reachable from a node
+
+        Mirrors KnowledgeGraphManager.traverse so a real Neo4j backend can
+        expand k-hop neighborhoods in one round trip instead of a Cypher
+        query per hop
+
+        Args:
+            root: Node name to start from
+            max_depth: How many hops to expand
+            rel_types: Optional set of relationship types to follow
+
+        Returns:
+            List of relationship records within max_depth hops of the root
+        """
+        logger.debug("Mock traversal executed from %s (max_depth=%s)", root, max_depth)
+        # Return empty results for all traversals
+        return []
+
     def close(self):
         """Close the connection to the Neo4j database"""
         logger.info("Closing mock Neo4j client connection")
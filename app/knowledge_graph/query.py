@@ -28,8 +28,22 @@ def query_knowledge_graph(query: str, filters: Optional[Dict[str, Any]] = None)
         "sources": []
     }
     
+    results = kg_results.get("results", [])
+
+    # Resolve every referenced entity in one batch up front, so the
+    # formatting loop reads names from a local dict instead of issuing a
+    # get_entity call per relationship end
+    needed_ids = set()
+    for item in results:
+        for rel in item.get("relationships", []):
+            if "target" in rel:
+                needed_ids.add(rel["target"])
+            if "source" in rel and rel["source"] != item["id"]:
+                needed_ids.add(rel["source"])
+    entities = kg_manager.get_entities(needed_ids) if needed_ids else {}
+
     # Process results
-    for item in kg_results.get("results", []):
+    for item in results:
         # Add concept information
         concept_info = {
             "id": item["id"],
@@ -55,17 +69,17 @@ def query_knowledge_graph(query: str, filters: Optional[Dict[str, Any]] = None)
             
             if "target" in rel:
                 relationship["target"] = rel["target"]
-                # Try to get the target name
-                target_entity = kg_manager.get_entity(rel["target"])
+                # Try to get the target name from the batch lookup
+                target_entity = entities.get(rel["target"])
                 if target_entity:
                     relationship["target_name"] = target_entity["properties"].get("name", rel["target"])
                 else:
                     relationship["target_name"] = rel["target"]
-            
+
             if "source" in rel and rel["source"] != item["id"]:
                 relationship["source"] = rel["source"]
-                # Try to get the source name
-                source_entity = kg_manager.get_entity(rel["source"])
+                # Try to get the source name from the batch lookup
+                source_entity = entities.get(rel["source"])
                 if source_entity:
                     relationship["source_name"] = source_entity["properties"].get("name", rel["source"])
                 else:
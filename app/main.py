@@ -2,7 +2,11 @@
 Main FastAPI application
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,20 +14,42 @@ import logging
 import os
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from app.api.chat import get_chat_service
+from app.api.knowledge_graph import prime_knowledge_graph
+from app.utils.api.http import close_http_client
 
-# Configure logging
-logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+def configure() -> None:
+    """Load environment variables and set up logging"""
+    # Runs from lifespan rather than at import, so merely importing the app
+    # (tests, tooling, autoreload scans) does no environment-file I/O
+    load_dotenv()
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage shared resources for the application lifetime"""
+    configure()
+    # Populate the knowledge graph and build the chat service in the
+    # background so startup is not blocked
+    prime_task = asyncio.create_task(prime_knowledge_graph())
+    warm_task = asyncio.create_task(asyncio.to_thread(get_chat_service))
+    yield
+    prime_task.cancel()
+    warm_task.cancel()
+    # Close the pooled HTTP client shared by the API clients
+    await close_http_client()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Finance ChatBot",
     description="A chatbot for financial information and analysis",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # JSON endpoints default to orjson serialization app-wide
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
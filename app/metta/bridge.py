@@ -8,8 +8,73 @@ import tempfile
 import re
 from typing import List, Dict, Any, Optional, Tuple, Set
 
+import ahocorasick
+
 logger = logging.getLogger(__name__)
 
+# Phrases that mark a definition query and the copulas used to locate the
+# term being defined; constants so _parse_query does not rebuild them
+DEFINITION_MARKERS = ("what is", "what are", "define", "explain")
+COPULA_WORDS = frozenset(("is", "are"))
+
+# Compiled once: one alternation scan for the markers (substring semantics,
+# like the old per-marker checks) and one search that jumps straight to the
+# word after the first standalone copula instead of re-splitting the query
+DEFINITION_MARKERS_PATTERN = re.compile("|".join(re.escape(marker) for marker in DEFINITION_MARKERS))
+COPULA_TERM_PATTERN = re.compile(r"(?:^|\s)(?:is|are)\s+(\S+)")
+
+# Every keyword tested by the branch ladder in _map_to_metta_query. One
+# automaton pass over the query collects all of them at once instead of a
+# substring scan per branch ("stock", "bond" and "crypto" also cover their
+# plural/long forms as substrings, so those need no extra entries).
+_QUERY_RULE_KEYWORDS = (
+    "inflation", "increase", "decrease", "interest rate", "high", "low",
+    "recession", "economic growth", "stock", "bond", "crypto",
+    "conservative", "moderate", "aggressive", "investor",
+    "property", "properties"
+)
+
+def _build_query_keyword_automaton() -> ahocorasick.Automaton:
+    """Index the mapping keywords so one pass finds all of them"""
+    automaton = ahocorasick.Automaton()
+    for keyword in _QUERY_RULE_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_QUERY_KEYWORD_AUTOMATON = _build_query_keyword_automaton()
+
+# Priority-ordered (predicate, query_info) rules for the static branches of
+# _map_to_metta_query, in the order of the old elif chain. Predicates only
+# test the precomputed keyword hits; the definition and property branches
+# stay in the method because they build dynamic patterns.
+_METTA_QUERY_RULES = (
+    (lambda hits: "inflation" in hits and "increase" in hits,
+     {"type": "effect", "pattern": "(effect-of inflation-increase ?X)"}),
+    (lambda hits: "inflation" in hits and "decrease" in hits,
+     {"type": "effect", "pattern": "(effect-of inflation-decrease ?X)"}),
+    (lambda hits: "interest rate" in hits and "high" in hits,
+     {"type": "effect", "pattern": "(effect-of high-interest-rates ?X)"}),
+    (lambda hits: "interest rate" in hits and "low" in hits,
+     {"type": "effect", "pattern": "(effect-of low-interest-rates ?X)"}),
+    (lambda hits: "recession" in hits,
+     {"type": "effect", "pattern": "(effect-of recession ?X)"}),
+    (lambda hits: "economic growth" in hits,
+     {"type": "effect", "pattern": "(effect-of economic-growth ?X)"}),
+    (lambda hits: "stock" in hits,
+     {"type": "asset", "pattern": "(asset-type stocks ?X)"}),
+    (lambda hits: "bond" in hits,
+     {"type": "asset", "pattern": "(asset-type bonds ?X)"}),
+    (lambda hits: "crypto" in hits,
+     {"type": "asset", "pattern": "(asset-type cryptocurrency ?X)"}),
+    (lambda hits: "conservative" in hits and "investor" in hits,
+     {"type": "advice", "pattern": "(suitable-for conservative-investor ?X)"}),
+    (lambda hits: "moderate" in hits and "investor" in hits,
+     {"type": "advice", "pattern": "(suitable-for moderate-investor ?X)"}),
+    (lambda hits: "aggressive" in hits and "investor" in hits,
+     {"type": "advice", "pattern": "(suitable-for aggressive-investor ?X)"}),
+)
+
 class MeTTaBridge:
     """
     Bridge between Python and MeTTa for symbolic reasoning
@@ -26,14 +91,14 @@ class MeTTaBridge:
         self.knowledge_path = knowledge_path
         self.metta_executable = os.getenv("METTA_EXECUTABLE", "metta")
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Initializing MeTTa bridge with knowledge at {knowledge_path}")
+        self.logger.info("Initializing MeTTa bridge with knowledge at %s", knowledge_path)
         
         # Check if MeTTa is installed
         try:
             self._check_metta_installation()
             self.metta_available = True
         except Exception as e:
-            self.logger.warning(f"MeTTa not available: {str(e)}. Will use fallback reasoning.")
+            self.logger.warning("MeTTa not available: %s. Will use fallback reasoning.", e)
             self.metta_available = False
             
         # Initialize cached reasoning patterns for fallback mode
@@ -49,9 +114,9 @@ class MeTTaBridge:
                 text=True, 
                 check=True
             )
-            self.logger.info(f"MeTTa version: {result.stdout.strip()}")
+            self.logger.info("MeTTa version: %s", result.stdout.strip())
         except (subprocess.SubprocessError, FileNotFoundError) as e:
-            self.logger.warning(f"MeTTa executable not found: {str(e)}")
+            self.logger.warning("MeTTa executable not found: %s", e)
             raise RuntimeError("MeTTa executable not found. Make sure OpenCog Hyperon is installed.")
     
     def query(self, query_pattern: str) -> List[Dict[str, Any]]:
@@ -88,7 +153,7 @@ class MeTTaBridge:
             # Parse results
             return self._parse_results(result.stdout)
         except Exception as e:
-            self.logger.error(f"Error executing MeTTa query: {str(e)}")
+            self.logger.error("Error executing MeTTa query: %s", e)
             return self._fallback_reasoning(query_pattern)
     
     def _parse_results(self, output: str) -> List[Dict[str, Any]]:
@@ -149,10 +214,10 @@ class MeTTaBridge:
                 term, definition = match
                 self.fallback_definitions[term] = definition
                 
-            self.logger.info(f"Loaded {len(self.fallback_rules)} rule types and {len(self.fallback_definitions)} definitions for fallback reasoning")
+            self.logger.info("Loaded %s rule types and %s definitions for fallback reasoning", len(self.fallback_rules), len(self.fallback_definitions))
             
         except Exception as e:
-            self.logger.error(f"Error initializing fallback reasoning: {str(e)}")
+            self.logger.error("Error initializing fallback reasoning: %s", e)
             self.fallback_rules = {}
             self.fallback_definitions = {}
     
@@ -213,7 +278,7 @@ class MeTTaBridge:
             return results
             
         except Exception as e:
-            self.logger.error(f"Error in fallback reasoning: {str(e)}")
+            self.logger.error("Error in fallback reasoning: %s", e)
             return []
     
     def reason_chain(self, query: str) -> Dict[str, Any]:
@@ -254,116 +319,55 @@ class MeTTaBridge:
     def _map_to_metta_query(self, query: str) -> Optional[Dict[str, Any]]:
         """
         Map natural language query to MeTTa query pattern
-        
+
+        One automaton pass collects every branch keyword, then the rules run
+        in priority order against the hit set instead of re-scanning the
+        query once per branch.
+
         Args:
             query: Natural language query
-            
+
         Returns:
             Dictionary containing query type and pattern
         """
         query = query.lower().strip()
-        
-        # Check for inflation-related queries
-        if "inflation" in query and "increase" in query:
-            return {
-                "type": "effect",
-                "pattern": "(effect-of inflation-increase ?X)"
-            }
-        elif "inflation" in query and "decrease" in query:
-            return {
-                "type": "effect",
-                "pattern": "(effect-of inflation-decrease ?X)"
-            }
-            
-        # Check for interest rate queries
-        elif "interest rate" in query and "high" in query:
-            return {
-                "type": "effect",
-                "pattern": "(effect-of high-interest-rates ?X)"
-            }
-        elif "interest rate" in query and "low" in query:
-            return {
-                "type": "effect",
-                "pattern": "(effect-of low-interest-rates ?X)"
-            }
-            
-        # Check for recession queries
-        elif "recession" in query:
-            return {
-                "type": "effect",
-                "pattern": "(effect-of recession ?X)"
-            }
-        elif "economic growth" in query:
-            return {
-                "type": "effect",
-                "pattern": "(effect-of economic-growth ?X)"
-            }
-            
-        # Check for asset type queries
-        elif "stock" in query or "stocks" in query:
-            return {
-                "type": "asset",
-                "pattern": "(asset-type stocks ?X)"
-            }
-        elif "bond" in query or "bonds" in query:
-            return {
-                "type": "asset",
-                "pattern": "(asset-type bonds ?X)"
-            }
-        elif "crypto" in query or "cryptocurrency" in query:
-            return {
-                "type": "asset",
-                "pattern": "(asset-type cryptocurrency ?X)"
-            }
-            
-        # Check for investment advice queries
-        elif "conservative" in query and "investor" in query:
-            return {
-                "type": "advice",
-                "pattern": "(suitable-for conservative-investor ?X)"
-            }
-        elif "moderate" in query and "investor" in query:
-            return {
-                "type": "advice",
-                "pattern": "(suitable-for moderate-investor ?X)"
-            }
-        elif "aggressive" in query and "investor" in query:
-            return {
-                "type": "advice",
-                "pattern": "(suitable-for aggressive-investor ?X)"
-            }
-            
+        hits = frozenset(keyword for _, keyword in _QUERY_KEYWORD_AUTOMATON.iter(query))
+
+        for predicate, query_info in _METTA_QUERY_RULES:
+            if predicate(hits):
+                # Copy so callers cannot mutate the shared rule table
+                return dict(query_info)
+
         # Check for definition queries
-        elif any(word in query for word in ["what is", "what are", "define", "explain"]):
-            # Extract the term to define
-            words = query.split()
-            for i, word in enumerate(words):
-                if word in ["is", "are"] and i + 1 < len(words):
-                    term = words[i + 1].strip("?.,")
-                    return {
-                        "type": "definition",
-                        "pattern": f"(definition {term})"
-                    }
-                    
+        if DEFINITION_MARKERS_PATTERN.search(query):
+            # Extract the term that follows the first standalone copula
+            match = COPULA_TERM_PATTERN.search(query)
+            if match:
+                term = match.group(1).strip("?.,")
+                return {
+                    "type": "definition",
+                    "pattern": f"(definition {term})"
+                }
+
         # Check for property queries
-        elif "property" in query or "properties" in query:
-            if "stock" in query or "stocks" in query:
+        elif "property" in hits or "properties" in hits:
+            if "stock" in hits:
                 return {
                     "type": "property",
                     "pattern": "(property-of stocks ?X)"
                 }
-            elif "crypto" in query or "cryptocurrency" in query:
+            elif "crypto" in hits:
                 return {
                     "type": "property",
                     "pattern": "(property-of crypto ?X)"
                 }
-                
+
         # Default to effect query if no specific pattern matches
         return {
             "type": "effect",
             "pattern": f"(effect-of {query} ?X)"
         }
-    
+
     def _generate_reasoning_chain(self, query_info: Dict[str, Any], results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Generate a reasoning chain from query results
@@ -11,6 +11,9 @@ class ChatRequest(BaseModel):
     """
     message: str
     session_id: Optional[str] = None
+    # Opt-in chunked delivery of long static answers; the JSON shape is
+    # unchanged, so non-streaming callers are unaffected
+    stream: bool = False
 
 class ChatResponse(BaseModel):
     """
@@ -1,5 +1,6 @@
 import os
 import json
+import logging
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 import openai
@@ -7,12 +8,14 @@ import openai
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Initialize OpenAI client
 api_key = os.getenv("OPENAI_API_KEY")
 if api_key:
     openai.api_key = api_key
 else:
-    print("Warning: OPENAI_API_KEY not found in environment variables. LLM functionality will be limited.")
+    logger.warning("OPENAI_API_KEY not found in environment variables. LLM functionality will be limited.")
 
 def format_chat_history(chat_history: List[Dict[str, str]]) -> List[Dict[str, str]]:
     """Format chat history for OpenAI API"""
@@ -123,9 +126,9 @@ def get_llm_response(query: str, chat_history: List[Dict[str, str]] = None, kg_c
             }
     
     except Exception as e:
-        print(f"Error getting LLM response: {str(e)}")
+        logger.error("Error getting LLM response: %s", e)
         return {
-            "text": f"I'm having trouble processing your request right now. Please try again later.",
+            "text": "I'm having trouble processing your request right now. Please try again later.",
             "error": str(e),
             "context": {
                 "used_kg": bool(kg_context)
@@ -1,6 +1,7 @@
 """
 Reasoning Service - Uses MeTTa for symbolic reasoning and logical inference
 """
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from app.metta import MeTTaBridge
@@ -30,8 +31,9 @@ class ReasoningService:
             Reasoning results including conclusion and reasoning steps
         """
         try:
-            # Use MeTTa to reason about the query
-            reasoning_result = self.metta.reason_chain(query)
+            # MeTTa reasoning shells out to a subprocess, so run it in a
+            # worker thread to keep the event loop free for other requests
+            reasoning_result = await asyncio.to_thread(self.metta.reason_chain, query)
             
             if not reasoning_result["success"]:
                 return {
@@ -52,7 +54,7 @@ class ReasoningService:
             }
             
         except Exception as e:
-            self.logger.error(f"Error in reasoning service: {str(e)}")
+            self.logger.error("Error in reasoning service: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -77,16 +79,18 @@ class ReasoningService:
         if not reasoning_steps:
             return conclusion
         
-        response = "Here's my reasoning:\n\n"
+        # Collect the parts and join once; repeated += on a str is
+        # quadratic in the worst case
+        parts = ["Here's my reasoning:\n\n"]
         
         # Add reasoning steps with numbering
         for i, step in enumerate(reasoning_steps, 1):
-            response += f"{i}. {step}\n"
+            parts.append(f"{i}. {step}\n")
         
         # Add the conclusion
-        response += f"\nTherefore, {conclusion}"
+        parts.append(f"\nTherefore, {conclusion}")
         
-        return response
+        return "".join(parts)
     
     def _extract_knowledge_graph(self, reasoning_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -106,13 +110,16 @@ class ReasoningService:
         
         # Extract reasoning steps
         reasoning_steps = reasoning_result.get("reasoning", [])
-        
+        conclusion = reasoning_result.get("conclusion", "")
+
         # Build a simple knowledge graph
         nodes = []
         edges = []
-        
-        # Add the main concept node
-        main_concept = reasoning_result.get("conclusion", "").split(":")[0].strip() if ":" in reasoning_result.get("conclusion", "") else "concept"
+
+        # Add the main concept node; partition finds and splits on the colon
+        # in one scan instead of an `in` check followed by a split
+        head, colon, _ = conclusion.partition(":")
+        main_concept = head.strip() if colon else "concept"
         
         # Clean up the main concept
         main_concept = main_concept.replace("causes", "").strip()
@@ -123,43 +130,56 @@ class ReasoningService:
             "type": "concept"
         })
         
+        # Ids of the nodes added so far: one set lookup per candidate instead
+        # of a linear scan over the node list
+        node_ids = {main_concept}
+        
         # Add nodes and edges from reasoning steps
         for step in reasoning_steps:
-            if "leads to" in step:
-                parts = step.split("leads to")
-                if len(parts) == 2:
-                    source = parts[0].replace("When", "").strip().rstrip(",")
-                    target = parts[1].strip().rstrip(".")
-                    
-                    # Add nodes if they don't exist
-                    if not any(node["id"] == source for node in nodes):
-                        nodes.append({
-                            "id": source,
-                            "label": source,
-                            "type": "cause"
-                        })
-                    
-                    if not any(node["id"] == target for node in nodes):
-                        nodes.append({
-                            "id": target,
-                            "label": target,
-                            "type": "effect"
-                        })
-                    
-                    # Add edge
-                    edges.append({
-                        "source": source,
-                        "target": target,
-                        "type": "leads_to"
+            # One split both detects and locates the marker; a step without
+            # exactly one "leads to" yields a part count other than two
+            parts = step.split("leads to")
+            if len(parts) == 2:
+                # "When" anchors the step, so a prefix strip beats a full
+                # replace scan
+                source = parts[0].removeprefix("When").strip().rstrip(",")
+                target = parts[1].strip().rstrip(".")
+                
+                # Add nodes if they don't exist
+                if source not in node_ids:
+                    node_ids.add(source)
+                    nodes.append({
+                        "id": source,
+                        "label": source,
+                        "type": "cause"
                     })
+                
+                if target not in node_ids:
+                    node_ids.add(target)
+                    nodes.append({
+                        "id": target,
+                        "label": target,
+                        "type": "effect"
+                    })
+                
+                # Add edge
+                edges.append({
+                    "source": source,
+                    "target": target,
+                    "type": "leads_to"
+                })
         
         # If no edges were created but we have properties, create property edges
-        if not edges and "Properties of" in reasoning_result.get("conclusion", ""):
-            subject, properties_text = reasoning_result.get("conclusion", "").split(":", 1)
-            subject = subject.replace("Properties of", "").strip()
+        if not edges and conclusion.startswith("Properties of"):
+            # The marker always anchors the conclusion, so startswith can
+            # bail on the first mismatched byte instead of scanning the
+            # whole string; the colon was already located above
+            subject = head[len("Properties of"):].strip()
+            properties_text = conclusion[len(head) + 1:]
             
             # Add subject node if not exists
-            if not any(node["id"] == subject for node in nodes):
+            if subject not in node_ids:
+                node_ids.add(subject)
                 nodes.append({
                     "id": subject,
                     "label": subject,
@@ -171,7 +191,8 @@ class ReasoningService:
                 prop = prop.strip()
                 if prop:
                     # Add property node
-                    if not any(node["id"] == prop for node in nodes):
+                    if prop not in node_ids:
+                        node_ids.add(prop)
                         nodes.append({
                             "id": prop,
                             "label": prop,
@@ -6,8 +6,11 @@ import logging
 import aiohttp
 import json
 import asyncio
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
+from app.utils.semantic_cache import SemanticCache
+
 # Load environment variables
 load_dotenv()
 
@@ -22,6 +25,15 @@ class AIService:
         self.max_retries = 3
         self.base_delay = 1  # Base delay in seconds
         
+        # Successful responses keyed by normalized prompt and context, so
+        # repeated or templated questions skip the network round trip. The
+        # short TTL keeps answers from going stale.
+        self._response_cache = TTLCache(maxsize=1024, ttl=300)
+
+        # Near-duplicate prompts ("what is bitcoin" vs "what's bitcoin")
+        # share responses through an embedding-similarity lookup
+        self._semantic_cache = SemanticCache(ttl=300)
+
         # Setup logging
         self.logger = logging.getLogger(__name__)
         self.logger.info("AI Service initialized with OpenAI")
@@ -42,19 +54,37 @@ class AIService:
                 self.logger.warning("OpenAI API key not found. Using fallback response.")
                 return "I don't have access to the AI service at the moment. Please check your API configuration."
             
+            # Whitespace-normalized key so trivial reformattings still hit
+            cache_key = (" ".join(prompt.lower().split()), context)
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                self.logger.info("Using cached AI response")
+                return cached_response
+
+            semantic_response = self._semantic_cache.get(prompt, context)
+            if semantic_response is not None:
+                self.logger.info("Using semantically cached AI response")
+                self._response_cache[cache_key] = semantic_response
+                return semantic_response
+
             for attempt in range(self.max_retries):
                 try:
-                    return await self._get_openai_response(prompt, context)
+                    response = await self._get_openai_response(prompt, context)
+                    # Only successful responses are cached; error fallbacks
+                    # below should retry on the next call
+                    self._response_cache[cache_key] = response
+                    self._semantic_cache.put(prompt, response, context)
+                    return response
                 except Exception as e:
                     if "429" in str(e) and attempt < self.max_retries - 1:  # Rate limit error
                         delay = self.base_delay * (2 ** attempt)  # Exponential backoff
-                        self.logger.warning(f"Rate limit hit, retrying in {delay} seconds...")
+                        self.logger.warning("Rate limit hit, retrying in %s seconds...", delay)
                         await asyncio.sleep(delay)
                         continue
                     raise e
             
         except Exception as e:
-            self.logger.error(f"Error getting AI response: {str(e)}")
+            self.logger.error("Error getting AI response: %s", e)
             if "429" in str(e):
                 return "I'm currently experiencing high traffic. Please try again in a few moments."
             return "I encountered an error while trying to get a response from the AI service."
@@ -110,9 +140,9 @@ class AIService:
                         return data["choices"][0]["message"]["content"].strip()
                     else:
                         error_text = await response.text()
-                        self.logger.error(f"OpenAI API error: {response.status} - {error_text}")
+                        self.logger.error("OpenAI API error: %s - %s", response.status, error_text)
                         raise Exception(f"OpenAI API error: {response.status}")
         
         except Exception as e:
-            self.logger.error(f"Error with OpenAI request: {str(e)}")
+            self.logger.error("Error with OpenAI request: %s", e)
             raise e 
\ No newline at end of file
@@ -84,7 +84,7 @@ class BaseAPIClient:
             delay = 1.0  # Default delay
             if self.rate_limit_reset:
                 delay = max(1.0, self.rate_limit_reset - time.time())
-            logger.warning(f"Rate limit almost reached for {self.api_name}. Waiting {delay:.2f} seconds")
+            logger.warning("Rate limit almost reached for %s. Waiting %.2f seconds", self.api_name, delay)
             time.sleep(delay)
     
     def _process_response(self, response: requests.Response) -> Dict[str, Any]:
@@ -117,14 +117,14 @@ class BaseAPIClient:
                     error_msg = data.get('error', data.get('errors', 'Unknown API error'))
                     if isinstance(error_msg, dict):
                         error_msg = error_msg.get('message', str(error_msg))
-                    logger.error(f"API error from {self.api_name}: {error_msg}")
+                    logger.error("API error from %s: %s", self.api_name, error_msg)
                     raise ValueError(f"API error: {error_msg}")
                     
             return data
             
         except ValueError as e:
             # JSON parsing error
-            logger.error(f"Failed to parse JSON from {self.api_name}: {str(e)}")
+            logger.error("Failed to parse JSON from %s: %s", self.api_name, e)
             raise ValueError(f"Invalid response format from {self.api_name}")
             
         except requests.HTTPError as e:
@@ -144,7 +144,7 @@ class BaseAPIClient:
                 if response.text:
                     error_msg = f"{error_msg}: {response.text[:100]}"
             
-            logger.error(f"HTTP error from {self.api_name}: {error_msg}")
+            logger.error("HTTP error from %s: %s", self.api_name, error_msg)
             raise ValueError(f"API request failed: {error_msg}")
     
     def request(self, 
@@ -184,7 +184,7 @@ class BaseAPIClient:
         if use_cache and method == "GET":
             cached_data = get_from_cache(self.api_name, cache_key, params, cache_type)
             if cached_data:
-                logger.debug(f"Using cached data for {self.api_name}/{endpoint}")
+                logger.debug("Using cached data for %s/%s", self.api_name, endpoint)
                 return cached_data
         
         # Prepare headers
@@ -228,31 +228,31 @@ class BaseAPIClient:
                 last_error = "Request timed out"
                 retry_count += 1
                 if retry_count <= MAX_RETRIES:
-                    logger.warning(f"Request timeout for {self.api_name}/{endpoint}, retrying...")
+                    logger.warning("Request timeout for %s/%s, retrying...", self.api_name, endpoint)
                     time.sleep(2 ** retry_count)  # Exponential backoff
                     
             except ConnectionError:
                 last_error = "Connection error"
                 retry_count += 1
                 if retry_count <= MAX_RETRIES:
-                    logger.warning(f"Connection error for {self.api_name}/{endpoint}, retrying...")
+                    logger.warning("Connection error for %s/%s, retrying...", self.api_name, endpoint)
                     time.sleep(2 ** retry_count)  # Exponential backoff
                     
             except RequestException as e:
                 last_error = str(e)
                 retry_count += 1
                 if retry_count <= MAX_RETRIES:
-                    logger.warning(f"Request failed for {self.api_name}/{endpoint}, retrying...")
+                    logger.warning("Request failed for %s/%s, retrying...", self.api_name, endpoint)
                     time.sleep(2 ** retry_count)  # Exponential backoff
                     
             except ValueError as e:
                 # Don't retry on value errors (invalid response format)
-                logger.error(f"Invalid response from {self.api_name}/{endpoint}: {str(e)}")
+                logger.error("Invalid response from %s/%s: %s", self.api_name, endpoint, e)
                 raise
                 
             except Exception as e:
                 # Don't retry on unexpected errors
-                logger.error(f"Unexpected error from {self.api_name}/{endpoint}: {str(e)}")
+                logger.error("Unexpected error from %s/%s: %s", self.api_name, endpoint, e)
                 raise
         
         # All retries failed
@@ -3,28 +3,87 @@ Caching utility for API responses
 Implements both in-memory and file-based caching with expiry
 """
 
+import asyncio
 import os
 import json
 import time
 import logging
+from enum import Enum
 from typing import Dict, Any, Optional, Tuple, Union
 import hashlib
 from pathlib import Path
-from app.utils.api.config import CACHE_EXPIRY, CACHE_ENABLED, CACHE_TTL
+from app.utils.api.config import CACHE_EXPIRY, CACHE_ENABLED, CACHE_TTL, CACHE_POLICY_TTLS, REDIS_URL
+
+# Optional Redis backend - used when REDIS_URL is configured and redis-py is installed
+try:
+    import redis
+except ImportError:
+    redis = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+class CachePolicy(str, Enum):
+    """
+    TTL tiers for cached API responses
+
+    SHORT is for volatile data like stock quotes, NORMAL for crypto prices,
+    LONG for static content like definitions
+    """
+    SHORT = "short"
+    NORMAL = "normal"
+    LONG = "long"
+
+    @property
+    def ttl(self) -> int:
+        """Expiry time in seconds for this policy tier"""
+        return CACHE_POLICY_TTLS.get(self.value, CACHE_TTL)
+
+# Keep stale entries around this many times longer than their TTL so they can
+# be served as a fallback when the upstream API fails
+STALE_TTL_FACTOR = 10
+
 # In-memory cache with size limit
 _memory_cache: Dict[str, Tuple[float, Any]] = {}
 MAX_MEMORY_CACHE_SIZE = 1000  # Maximum number of items in memory cache
 
+# Whether a Redis tier can come into play at all; decided from config so the
+# async accessors can choose a path without connecting
+_REDIS_CONFIGURED = bool(REDIS_URL) and redis is not None
+
+# Lazily-created Redis client (None until first successful connection)
+_redis_client = None
+
+def _get_redis_client():
+    """
+    Get the shared Redis client, connecting on first use
+
+    Returns:
+        Connected Redis client, or None when Redis is not configured/available
+    """
+    global _redis_client
+    if _redis_client is not None or not REDIS_URL or redis is None:
+        return _redis_client
+    try:
+        client = redis.Redis.from_url(REDIS_URL, decode_responses=False)
+        client.ping()
+        try:
+            # Prefer LFU eviction so frequently requested symbols stay cached
+            client.config_set("maxmemory-policy", "allkeys-lfu")
+        except Exception as e:
+            logger.warning("Could not set Redis eviction policy: %s", e)
+        _redis_client = client
+        logger.info("Connected to Redis cache backend")
+    except Exception as e:
+        logger.warning("Redis cache unavailable, using memory/file cache: %s", e)
+    return _redis_client
+
 # Cache directory with error handling
 try:
     CACHE_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))) / 'data' / 'cache'
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 except Exception as e:
-    logger.error(f"Failed to create cache directory: {str(e)}")
+    logger.error("Failed to create cache directory: %s", e)
     CACHE_DIR = None
 
 def _get_cache_key(api_name: str, endpoint: str, params: Dict[str, Any]) -> str:
@@ -45,7 +104,7 @@ def _get_cache_key(api_name: str, endpoint: str, params: Dict[str, Any]) -> str:
         key_str = f"{api_name}:{endpoint}:{params_str}"
         return hashlib.md5(key_str.encode()).hexdigest()
     except Exception as e:
-        logger.error(f"Error generating cache key: {str(e)}")
+        logger.error("Error generating cache key: %s", e)
         return hashlib.md5(f"{api_name}:{endpoint}".encode()).hexdigest()
 
 def _cleanup_memory_cache() -> None:
@@ -56,37 +115,62 @@ def _cleanup_memory_cache() -> None:
         items_to_remove = len(_memory_cache) - MAX_MEMORY_CACHE_SIZE
         for key, _ in sorted_items[:items_to_remove]:
             del _memory_cache[key]
-        logger.info(f"Cleaned up {items_to_remove} items from memory cache")
+        logger.info("Cleaned up %s items from memory cache", items_to_remove)
 
-def get_from_cache(api_name: str, endpoint: str, params: Dict[str, Any], cache_type: str = "memory") -> Optional[Any]:
+def get_from_cache(api_name: str, endpoint: str, params: Dict[str, Any], cache_type: str = "memory",
+                   policy: Optional[CachePolicy] = None, allow_stale: bool = False) -> Optional[Any]:
     """
     Get data from cache if available and not expired
-    
+
     Args:
         api_name: Name of the API
         endpoint: API endpoint
         params: Request parameters
         cache_type: Type of cache to use ('memory' or 'file')
-        
+        policy: Optional cache policy tier overriding the per-endpoint expiry
+        allow_stale: Return expired entries instead of discarding them
+            (used as a fallback when the upstream API fails)
+
     Returns:
         Cached data if available and not expired, None otherwise
     """
     if not CACHE_ENABLED:
         return None
-        
+
     try:
         key = _get_cache_key(api_name, endpoint, params)
-        expiry_time = CACHE_EXPIRY.get(endpoint.split('/')[-1], CACHE_TTL)
-        
+        if policy is not None:
+            expiry_time = policy.ttl
+        else:
+            expiry_time = CACHE_EXPIRY.get(endpoint.split('/')[-1], CACHE_TTL)
+
+        # Check Redis first when configured
+        redis_client = _get_redis_client()
+        if redis_client:
+            try:
+                raw = redis_client.get(key)
+                if raw is not None:
+                    cache_data = json.loads(raw)
+                    timestamp = cache_data.get('timestamp', 0)
+                    if allow_stale or time.time() - timestamp < expiry_time:
+                        return cache_data.get('data')
+            except Exception as e:
+                logger.warning("Error reading from Redis cache: %s", e)
+
         # Check memory cache first
         if cache_type == "memory" and key in _memory_cache:
             timestamp, data = _memory_cache[key]
-            if time.time() - timestamp < expiry_time:
+            age = time.time() - timestamp
+            if age < expiry_time:
                 return data
-            else:
-                # Remove expired data
+            elif allow_stale and age < expiry_time * STALE_TTL_FACTOR:
+                return data
+            elif age >= expiry_time * STALE_TTL_FACTOR:
+                # Expired entries stay through the stale window so an API
+                # failure can still serve the last known value; only purge
+                # beyond it
                 del _memory_cache[key]
-        
+
         # Check file cache if requested or memory cache not available
         if (cache_type == "file" or (cache_type == "memory" and key not in _memory_cache)) and CACHE_DIR:
             cache_file = CACHE_DIR / f"{key}.json"
@@ -95,47 +179,76 @@ def get_from_cache(api_name: str, endpoint: str, params: Dict[str, Any], cache_t
                     with open(cache_file, 'r') as f:
                         cache_data = json.load(f)
                     timestamp = cache_data.get('timestamp', 0)
-                    if time.time() - timestamp < expiry_time:
+                    age = time.time() - timestamp
+                    if age < expiry_time:
+                        return cache_data.get('data')
+                    elif allow_stale and age < expiry_time * STALE_TTL_FACTOR:
                         return cache_data.get('data')
-                    else:
-                        # Remove expired file
+                    elif age >= expiry_time * STALE_TTL_FACTOR:
+                        # Same stale-window retention as the memory tier
                         cache_file.unlink()
                 except (json.JSONDecodeError, FileNotFoundError) as e:
-                    logger.warning(f"Error reading cache file: {str(e)}")
+                    logger.warning("Error reading cache file: %s", e)
                     if cache_file.exists():
                         cache_file.unlink()
-        
+
         return None
-        
+
     except Exception as e:
-        logger.error(f"Error accessing cache: {str(e)}")
+        logger.error("Error accessing cache: %s", e)
         return None
 
-def save_to_cache(api_name: str, endpoint: str, params: Dict[str, Any], data: Any, cache_type: str = "memory") -> None:
+async def get_from_cache_async(api_name: str, endpoint: str, params: Dict[str, Any], cache_type: str = "memory",
+                               policy: Optional[CachePolicy] = None, allow_stale: bool = False) -> Optional[Any]:
+    """
+    get_from_cache for event-loop callers
+
+    When Redis is configured the lookup (including its blocking network
+    round trip and first-use connect) runs in a worker thread; otherwise
+    the memory/file tiers are cheap enough to read inline.
+    """
+    if _REDIS_CONFIGURED:
+        return await asyncio.to_thread(get_from_cache, api_name, endpoint, params, cache_type, policy, allow_stale)
+    return get_from_cache(api_name, endpoint, params, cache_type, policy, allow_stale)
+
+def save_to_cache(api_name: str, endpoint: str, params: Dict[str, Any], data: Any, cache_type: str = "memory",
+                  policy: Optional[CachePolicy] = None) -> None:
     """
     Save data to cache with improved error handling
-    
+
     Args:
         api_name: Name of the API
         endpoint: API endpoint
         params: Request parameters
         data: Data to cache
         cache_type: Type of cache to use ('memory', 'file', or 'both')
+        policy: Optional cache policy tier controlling the Redis expiry
     """
     if not CACHE_ENABLED:
         return
-        
+
     try:
         key = _get_cache_key(api_name, endpoint, params)
         timestamp = time.time()
-        
+
+        # Save to Redis when configured; keep the entry around past its TTL
+        # so stale reads can serve it as an API-failure fallback
+        redis_client = _get_redis_client()
+        if redis_client:
+            try:
+                ttl = policy.ttl if policy is not None else CACHE_EXPIRY.get(endpoint.split('/')[-1], CACHE_TTL)
+                payload = json.dumps({'timestamp': timestamp, 'data': data})
+                redis_client.set(key, payload, ex=ttl * STALE_TTL_FACTOR)
+            except Exception as e:
+                logger.warning("Error saving to Redis cache: %s", e)
+
         # Save to memory cache
-        if cache_type in ["memory", "both"]:
+        if cache_type in ("memory", "both"):
             _memory_cache[key] = (timestamp, data)
             _cleanup_memory_cache()
         
         # Save to file cache
-        if (cache_type in ["file", "both"]) and CACHE_DIR:
+        if (cache_type in ("file", "both")) and CACHE_DIR:
             cache_file = CACHE_DIR / f"{key}.json"
             try:
                 with open(cache_file, 'w') as f:
@@ -144,7 +257,7 @@ def save_to_cache(api_name: str, endpoint: str, params: Dict[str, Any], data: An
                         'data': data
                     }, f)
             except (IOError, OSError) as e:
-                logger.error(f"Error saving to file cache: {str(e)}")
+                logger.error("Error saving to file cache: %s", e)
                 if cache_file.exists():
                     try:
                         cache_file.unlink()
@@ -152,7 +265,20 @@ def save_to_cache(api_name: str, endpoint: str, params: Dict[str, Any], data: An
                         pass
                         
     except Exception as e:
-        logger.error(f"Error saving to cache: {str(e)}")
+        logger.error("Error saving to cache: %s", e)
+
+async def save_to_cache_async(api_name: str, endpoint: str, params: Dict[str, Any], data: Any, cache_type: str = "memory",
+                              policy: Optional[CachePolicy] = None) -> None:
+    """
+    save_to_cache for event-loop callers
+
+    Same thread offload as get_from_cache_async, so a Redis write cannot
+    stall the loop.
+    """
+    if _REDIS_CONFIGURED:
+        await asyncio.to_thread(save_to_cache, api_name, endpoint, params, data, cache_type, policy)
+    else:
+        save_to_cache(api_name, endpoint, params, data, cache_type, policy)
 
 def clear_cache(api_name: Optional[str] = None, endpoint: Optional[str] = None, cache_type: str = "both") -> None:
     """
@@ -165,7 +291,7 @@ def clear_cache(api_name: Optional[str] = None, endpoint: Optional[str] = None,
     """
     try:
         # Clear memory cache
-        if cache_type in ["memory", "both"]:
+        if cache_type in ("memory", "both"):
             if api_name is None and endpoint is None:
                 _memory_cache.clear()
             elif api_name is not None and endpoint is None:
@@ -177,7 +303,7 @@ def clear_cache(api_name: Optional[str] = None, endpoint: Optional[str] = None,
                 _memory_cache = {k: v for k, v in _memory_cache.items() if not k.startswith(prefix)}
         
         # Clear file cache
-        if (cache_type in ["file", "both"]) and CACHE_DIR:
+        if (cache_type in ("file", "both")) and CACHE_DIR:
             try:
                 if api_name is None and endpoint is None:
                     # Clear all files
@@ -185,7 +311,7 @@ def clear_cache(api_name: Optional[str] = None, endpoint: Optional[str] = None,
                         try:
                             file.unlink()
                         except OSError as e:
-                            logger.warning(f"Error removing cache file {file}: {str(e)}")
+                            logger.warning("Error removing cache file %s: %s", file, e)
                 else:
                     # Selective file clearing for specific API/endpoint
                     for file in CACHE_DIR.glob('*.json'):
@@ -194,12 +320,12 @@ def clear_cache(api_name: Optional[str] = None, endpoint: Optional[str] = None,
                                 try:
                                     file.unlink()
                                 except OSError as e:
-                                    logger.warning(f"Error removing cache file {file}: {str(e)}")
+                                    logger.warning("Error removing cache file %s: %s", file, e)
             except Exception as e:
-                logger.error(f"Error clearing file cache: {str(e)}")
+                logger.error("Error clearing file cache: %s", e)
                 
     except Exception as e:
-        logger.error(f"Error clearing cache: {str(e)}")
+        logger.error("Error clearing cache: %s", e)
 
 def get_cache_stats() -> Dict[str, Any]:
     """
@@ -220,12 +346,12 @@ def get_cache_stats() -> Dict[str, Any]:
             try:
                 stats["file_cache_size"] = len(list(CACHE_DIR.glob('*.json')))
             except Exception as e:
-                logger.error(f"Error getting file cache size: {str(e)}")
+                logger.error("Error getting file cache size: %s", e)
         
         return stats
         
     except Exception as e:
-        logger.error(f"Error getting cache stats: {str(e)}")
+        logger.error("Error getting cache stats: %s", e)
         return {
             "error": str(e),
             "memory_cache_size": 0,
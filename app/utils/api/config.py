@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 try:
     load_dotenv()
 except Exception as e:
-    logger.warning(f"Failed to load .env file: {str(e)}")
+    logger.warning("Failed to load .env file: %s", e)
 
 def get_env_var(key: str, default: str = "") -> str:
     """
@@ -31,10 +31,10 @@ def get_env_var(key: str, default: str = "") -> str:
     try:
         value = os.getenv(key, default)
         if not value and key.endswith("_API_KEY"):
-            logger.warning(f"Missing API key for {key}")
+            logger.warning("Missing API key for %s", key)
         return value
     except Exception as e:
-        logger.error(f"Error getting environment variable {key}: {str(e)}")
+        logger.error("Error getting environment variable %s: %s", key, e)
         return default
 
 def get_int_env_var(key: str, default: int, min_value: int = 0) -> int:
@@ -53,7 +53,7 @@ def get_int_env_var(key: str, default: int, min_value: int = 0) -> int:
         value = int(get_env_var(key, str(default)))
         return max(value, min_value)
     except ValueError:
-        logger.warning(f"Invalid {key} format, using default of {default}")
+        logger.warning("Invalid %s format, using default of %s", key, default)
         return default
 
 # API KEYS
@@ -74,6 +74,16 @@ CACHE_ENABLED = get_env_var("CACHE_ENABLED", "true").lower() == "true"
 CACHE_TTL = get_int_env_var("CACHE_TTL", 300, min_value=1)  # Default 5 minutes
 MAX_MEMORY_CACHE_SIZE = get_int_env_var("MAX_MEMORY_CACHE_SIZE", 1000, min_value=100)  # Default 1000 items
 
+# Optional Redis cache backend (falls back to memory/file cache when unset)
+REDIS_URL = get_env_var("REDIS_URL", "")
+
+# TTL tiers for cache policies (seconds)
+CACHE_POLICY_TTLS: Dict[str, int] = {
+    "short": get_int_env_var("CACHE_SHORT_TTL", 10, min_value=1),       # volatile data (stock quotes)
+    "normal": get_int_env_var("CACHE_NORMAL_TTL", 30, min_value=1),     # crypto prices
+    "long": get_int_env_var("CACHE_LONG_TTL", 3600, min_value=1)        # static/definition replies
+}
+
 # Cache expiry times with validation
 CACHE_EXPIRY: Dict[str, int] = {
     "stock_price": get_int_env_var("CACHE_STOCK_PRICE_EXPIRY", 300, min_value=1),  # 5 minutes
@@ -107,12 +117,12 @@ CACHE_FILE_SUFFIX = get_env_var("CACHE_FILE_SUFFIX", ".json")
 # Log cache settings
 if CACHE_ENABLED:
     logger.info("Cache settings:")
-    logger.info(f"  Enabled: {CACHE_ENABLED}")
-    logger.info(f"  Default TTL: {CACHE_TTL} seconds")
-    logger.info(f"  Max memory cache size: {MAX_MEMORY_CACHE_SIZE} items")
-    logger.info(f"  Cache directory: {CACHE_DIR}")
+    logger.info("  Enabled: %s", CACHE_ENABLED)
+    logger.info("  Default TTL: %s seconds", CACHE_TTL)
+    logger.info("  Max memory cache size: %s items", MAX_MEMORY_CACHE_SIZE)
+    logger.info("  Cache directory: %s", CACHE_DIR)
     logger.info("  Cache expiry times:")
     for key, value in CACHE_EXPIRY.items():
-        logger.info(f"    {key}: {value} seconds")
+        logger.info("    %s: %s seconds", key, value)
 else:
     logger.warning("Caching is disabled") 
\ No newline at end of file
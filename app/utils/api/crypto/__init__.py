@@ -9,6 +9,7 @@ import os
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
+from cachetools import TTLCache
 from pycoingecko import CoinGeckoAPI
 from dotenv import load_dotenv
 
@@ -60,6 +61,10 @@ class CryptoAPI:
         self.cg = CoinGeckoAPI()
         self.cache = {}
         self.cache_duration = timedelta(minutes=5)
+
+        # Short-lived price cache so bursts of lookups for the same symbol
+        # (e.g. candidate loops in the chat service) hit one provider call
+        self._price_cache = TTLCache(maxsize=1024, ttl=30)
         
         # Mock data for fallback
         self.mock_data = {
@@ -153,14 +158,18 @@ class CryptoAPI:
             # Try to get real data from CoinGecko
             try:
                 # For BTC and ETH which we know are supported
-                if symbol in ["BTC", "ETH"]:
+                if symbol in ("BTC", "ETH"):
                     coin_id = "bitcoin" if symbol == "BTC" else "ethereum"
-                    
-                    data = self.cg.get_price(ids=coin_id, 
-                                           vs_currencies='usd',
-                                           include_24hr_change=True,
-                                           include_market_cap=True,
-                                           include_24hr_vol=True)
+
+                    # The CoinGecko client is requests-based, so run it in a
+                    # worker thread instead of blocking the event loop
+                    data = await asyncio.to_thread(
+                        self.cg.get_price,
+                        ids=coin_id,
+                        vs_currencies='usd',
+                        include_24hr_change=True,
+                        include_market_cap=True,
+                        include_24hr_vol=True)
                     
                     if data and coin_id in data:
                         crypto_data = {
@@ -176,13 +185,13 @@ class CryptoAPI:
                         self.cache[symbol] = (crypto_data, datetime.now())
                         return crypto_data
             except Exception as e:
-                logger.warning(f"CoinGecko failed for {symbol}: {str(e)}")
+                logger.warning("CoinGecko failed for %s: %s", symbol, e)
 
             # Try CoinMarketCap as backup
             try:
                 if hasattr(self.coinmarketcap, 'api_key') and self.coinmarketcap.api_key:
-                    # CoinMarketCap client doesn't have async methods, so we're just calling it directly
-                    data = self.coinmarketcap.get_crypto_price(symbol)
+                    # CoinMarketCap client doesn't have async methods, so offload it to a thread
+                    data = await asyncio.to_thread(self.coinmarketcap.get_crypto_price, symbol)
                     if data and "error" not in data:
                         crypto_data = {
                             "symbol": symbol,
@@ -197,11 +206,11 @@ class CryptoAPI:
                         self.cache[symbol] = (crypto_data, datetime.now())
                         return crypto_data
             except Exception as e:
-                logger.warning(f"CoinMarketCap failed for {symbol}: {str(e)}")
+                logger.warning("CoinMarketCap failed for %s: %s", symbol, e)
 
             # If real data fails, use mock data
             if symbol in self.mock_data:
-                logger.info(f"Using mock data for {symbol}")
+                logger.info("Using mock data for %s", symbol)
                 mock_data = self.mock_data[symbol]
                 crypto_data = {
                     "symbol": mock_data["symbol"],
@@ -219,7 +228,7 @@ class CryptoAPI:
             return None
 
         except Exception as e:
-            logger.error(f"Error getting crypto data for {symbol}: {str(e)}")
+            logger.error("Error getting crypto data for %s: %s", symbol, e)
             return None
     
     async def get_crypto_price(self, 
@@ -239,7 +248,13 @@ class CryptoAPI:
         """
         # Normalize symbol
         symbol = self._normalize_symbol(symbol)
-        
+
+        # Serve recent results straight from the TTL cache
+        cache_key = (symbol, convert)
+        cached = self._price_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Use mock data as fallback
         mock_data = self.mock.get_crypto_price(symbol, convert) if self.mock else None
 
@@ -255,29 +270,30 @@ class CryptoAPI:
                     if provider == "mock" and self.mock:
                         result = self.mock.get_crypto_price(symbol, convert)
                     elif provider == "coingecko":
-                        result = self.coingecko.get_crypto_price(symbol, convert)
+                        result = await asyncio.to_thread(self.coingecko.get_crypto_price, symbol, convert)
                     elif provider == "coinmarketcap":
-                        result = self.coinmarketcap.get_crypto_price(symbol, convert)
-                    
+                        result = await asyncio.to_thread(self.coinmarketcap.get_crypto_price, symbol, convert)
+
                     # Check if result contains error
                     if not result or "error" in result:
                         continue
-                    
+
                     # Add provider info to result
                     result["provider"] = provider
+                    self._price_cache[cache_key] = result
                     return result
-                
+
             except Exception as e:
-                logger.error(f"Error getting {symbol} price from {preferred_provider}: {str(e)}")
+                logger.error("Error getting %s price from %s: %s", symbol, preferred_provider, e)
         
         # Try all available providers
         for provider in self.provider_priority["price"]:
             if provider == "mock" and self.mock:
                 result = self.mock.get_crypto_price(symbol, convert)
             elif provider == "coingecko":
-                result = self.coingecko.get_crypto_price(symbol, convert)
+                result = await asyncio.to_thread(self.coingecko.get_crypto_price, symbol, convert)
             elif provider == "coinmarketcap":
-                result = self.coinmarketcap.get_crypto_price(symbol, convert)
+                result = await asyncio.to_thread(self.coinmarketcap.get_crypto_price, symbol, convert)
             
             # Check if result is empty
             if not result:
@@ -286,14 +302,15 @@ class CryptoAPI:
             # Add provider info to result (as first element's metadata)
             if len(result) > 0 and isinstance(result[0], dict):
                 result[0]["provider"] = provider
-            
+
+            self._price_cache[cache_key] = result
             return result
-        
+
         # Fall back to mock data if all else fails
         if mock_data:
             mock_data["provider"] = "mock"
             return mock_data
-            
+
         return None
     
     def get_crypto_details(self, 
@@ -364,7 +381,7 @@ class CryptoAPI:
                 return result
                 
             except Exception as e:
-                logger.error(f"Error getting {symbol} details from {provider}: {str(e)}")
+                logger.error("Error getting %s details from %s: %s", symbol, provider, e)
                 errors.append(f"{provider}: {str(e)}")
         
         # All providers failed
@@ -442,7 +459,7 @@ class CryptoAPI:
                 return result
                 
             except Exception as e:
-                logger.error(f"Error getting {symbol} historical data from {provider}: {str(e)}")
+                logger.error("Error getting %s historical data from %s: %s", symbol, provider, e)
                 errors.append(f"{provider}: {str(e)}")
         
         # All providers failed
@@ -493,7 +510,7 @@ class CryptoAPI:
                         all_results.append(result)
                 
             except Exception as e:
-                logger.error(f"Error searching for '{query}' from {provider}: {str(e)}")
+                logger.error("Error searching for '%s' from %s: %s", query, provider, e)
                 errors.append(f"{provider}: {str(e)}")
         
         return all_results
@@ -573,7 +590,7 @@ class CryptoAPI:
                 return result
                 
             except Exception as e:
-                logger.error(f"Error getting market summary from {provider}: {str(e)}")
+                logger.error("Error getting market summary from %s: %s", provider, e)
                 errors.append(f"{provider}: {str(e)}")
         
         # All providers failed
@@ -612,7 +629,7 @@ class CryptoAPI:
             return pairs
             
         except Exception as e:
-            logger.error(f"Error fetching trading pairs: {str(e)}")
+            logger.error("Error fetching trading pairs: %s", e)
             return []
     
     def get_price(self, symbol: str, convert: str = "USD") -> Dict[str, Any]:
@@ -652,7 +669,7 @@ class CryptoAPI:
             }
             
         except Exception as e:
-            logger.error(f"Error in get_price for {symbol}: {str(e)}")
+            logger.error("Error in get_price for %s: %s", symbol, e)
             return {
                 "error": "Internal error",
                 "details": str(e)
@@ -660,5 +677,5 @@ class CryptoAPI:
 
     def _validate_crypto_price(self, data):
         """Validate crypto price data has required fields"""
-        required_fields = ['price', 'percent_change_24h', 'market_cap']
+        required_fields = ('price', 'percent_change_24h', 'market_cap')
         return all(field in data for field in required_fields) 
\ No newline at end of file
@@ -10,6 +10,7 @@ import requests
 import os
 import asyncio
 import aiohttp
+from cachetools import TTLCache
 
 from app.utils.api.base import BaseAPIClient
 from app.utils.api.config import COINGECKO_BASE_URL, RATE_LIMITS
@@ -34,6 +35,10 @@ class CoinGeckoClient(BaseAPIClient):
         self.rate_limit = RATE_LIMITS.get("coingecko", 50)  # Default to 50 if not found
         self.last_api_call = 0
         self.min_call_interval = 6  # seconds between calls for free tier
+
+        # Project info cache: candidate loops probe the same handful of
+        # symbols over and over, and each miss can cost a price API call
+        self._project_info_cache = TTLCache(maxsize=2048, ttl=300)
         
         # Common cryptocurrency symbol to CoinGecko ID mapping
         self.symbol_to_id = {
@@ -99,7 +104,16 @@ class CoinGeckoClient(BaseAPIClient):
                 "description": "Decentralized data exchange protocol to unlock data for AI. Allows data to be shared while preserving privacy and control."
             }
         }
-    
+
+        # Pre-index the catalog by lowercased category with the symbol already
+        # merged in, so category lookups compare a handful of category keys
+        # instead of re-lowering and re-merging every project dict per call
+        self._projects_by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for symbol, data in self.funded_projects.items():
+            entry = {"symbol": symbol, **data}
+            bucket = data.get("category", "").lower()
+            self._projects_by_category.setdefault(bucket, []).append(entry)
+
     def _respect_rate_limit(self):
         """Ensure we don't exceed rate limits"""
         current_time = time.time()
@@ -108,7 +122,7 @@ class CoinGeckoClient(BaseAPIClient):
         if time_since_last_call < self.min_call_interval:
             # Sleep to respect rate limit
             sleep_time = self.min_call_interval - time_since_last_call
-            logger.debug(f"Rate limiting - sleeping for {sleep_time:.2f} seconds")
+            logger.debug("Rate limiting - sleeping for %.2f seconds", sleep_time)
             time.sleep(sleep_time)
         
         self.last_api_call = time.time()
@@ -129,10 +143,10 @@ class CoinGeckoClient(BaseAPIClient):
                     if coin.get('symbol', '').upper() == symbol:
                         return coin.get('id')
             
-            logger.warning(f"Could not find CoinGecko ID for {symbol}")
+            logger.warning("Could not find CoinGecko ID for %s", symbol)
             return symbol.lower()  # fallback
         except Exception as e:
-            logger.error(f"Error finding coin ID: {str(e)}")
+            logger.error("Error finding coin ID: %s", e)
             return symbol.lower()  # fallback
     
     def get_crypto_price(self, symbol: str, currency: str = "USD") -> Optional[Dict[str, Any]]:
@@ -152,23 +166,23 @@ class CoinGeckoClient(BaseAPIClient):
             
             # Get market data for more comprehensive information
             url = f"{self.base_url}/coins/{coin_id}?localization=false&tickers=false&market_data=true&community_data=false&developer_data=false"
-            logger.debug(f"Fetching data from {url}")
+            logger.debug("Fetching data from %s", url)
             
             response = requests.get(url)
             
             # Check for errors
             if response.status_code == 429:
-                logger.warning(f"Rate limit exceeded for CoinGecko API")
+                logger.warning("Rate limit exceeded for CoinGecko API")
                 raise Exception("Rate limit exceeded")
             
             if response.status_code != 200:
-                logger.error(f"HTTP error from coingecko: HTTP {response.status_code}")
+                logger.error("HTTP error from coingecko: HTTP %s", response.status_code)
                 raise Exception(f"API request failed: HTTP {response.status_code}")
             
             data = response.json()
             
             if not data or "market_data" not in data:
-                logger.error(f"Invalid response from coingecko/coins/{coin_id}: {data}")
+                logger.error("Invalid response from coingecko/coins/%s: %s", coin_id, data)
                 raise Exception("API request failed: Invalid response format")
             
             market_data = data["market_data"]
@@ -192,7 +206,7 @@ class CoinGeckoClient(BaseAPIClient):
             return result
             
         except Exception as e:
-            logger.error(f"Error fetching cryptocurrency details for {symbol}: {str(e)}")
+            logger.error("Error fetching cryptocurrency details for %s: %s", symbol, e)
             return None
     
     def get_historical_data(self, symbol: str, days: int = 7, interval: str = "daily", currency: str = "usd") -> Optional[Dict[str, Any]]:
@@ -226,13 +240,13 @@ class CoinGeckoClient(BaseAPIClient):
             
             # Check for errors
             if response.status_code != 200:
-                logger.error(f"HTTP error from coingecko: HTTP {response.status_code}")
+                logger.error("HTTP error from coingecko: HTTP %s", response.status_code)
                 raise Exception(f"API request failed: HTTP {response.status_code}")
             
             data = response.json()
             
             if not data or "prices" not in data:
-                logger.error(f"Invalid response from coingecko/coins/{coin_id}/market_chart: {data}")
+                logger.error("Invalid response from coingecko/coins/%s/market_chart: %s", coin_id, data)
                 raise Exception("API request failed: Invalid response format")
             
             # Format the data for easier consumption
@@ -262,7 +276,7 @@ class CoinGeckoClient(BaseAPIClient):
             }
             
         except Exception as e:
-            logger.error(f"Error fetching historical data for {symbol}: {str(e)}")
+            logger.error("Error fetching historical data for %s: %s", symbol, e)
             return None
     
     def search_cryptocurrency(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
@@ -282,7 +296,7 @@ class CoinGeckoClient(BaseAPIClient):
             response = requests.get(f"{self.base_url}/search?query={query}")
             
             if response.status_code != 200:
-                logger.error(f"HTTP error from coingecko: HTTP {response.status_code}")
+                logger.error("HTTP error from coingecko: HTTP %s", response.status_code)
                 return []
             
             data = response.json()
@@ -306,7 +320,7 @@ class CoinGeckoClient(BaseAPIClient):
             return results
             
         except Exception as e:
-            logger.error(f"Error searching for cryptocurrencies: {str(e)}")
+            logger.error("Error searching for cryptocurrencies: %s", e)
             return []
     
     def get_crypto_details(self, crypto_id: str) -> Dict[str, Any]:
@@ -329,7 +343,7 @@ class CoinGeckoClient(BaseAPIClient):
             })
             
             if "id" not in response:
-                logger.warning(f"Invalid response format from CoinGecko details for {crypto_id}")
+                logger.warning("Invalid response format from CoinGecko details for %s", crypto_id)
                 return {
                     "id": crypto_id,
                     "error": "not_found",
@@ -379,7 +393,7 @@ class CoinGeckoClient(BaseAPIClient):
             return crypto_details
         
         except Exception as e:
-            logger.error(f"Error fetching cryptocurrency details for {crypto_id}: {str(e)}")
+            logger.error("Error fetching cryptocurrency details for %s: %s", crypto_id, e)
             return {
                 "id": crypto_id,
                 "error": "api_error",
@@ -416,7 +430,7 @@ class CoinGeckoClient(BaseAPIClient):
             return results
         
         except Exception as e:
-            logger.error(f"Error fetching trending cryptocurrencies: {str(e)}")
+            logger.error("Error fetching trending cryptocurrencies: %s", e)
             return []
             
     def get_project_info(self, symbol: str) -> Dict[str, Any]:
@@ -430,7 +444,15 @@ class CoinGeckoClient(BaseAPIClient):
             Dictionary with project information or None if not found
         """
         symbol = symbol.upper()
-        
+        cached = self._project_info_cache.get(symbol)
+        if cached is not None:
+            return cached
+        info = self._fetch_project_info(symbol)
+        self._project_info_cache[symbol] = info
+        return info
+
+    def _fetch_project_info(self, symbol: str) -> Dict[str, Any]:
+        """Resolve project info from the funded-projects db or price data"""
         # Check if it's in our database of funded projects
         if symbol in self.funded_projects:
             return {
@@ -471,12 +493,11 @@ class CoinGeckoClient(BaseAPIClient):
         """
         results = []
         category = category.lower()
-        
-        for symbol, data in self.funded_projects.items():
-            if category in data.get("category", "").lower():
-                results.append({
-                    "symbol": symbol,
-                    **data
-                })
-                
+
+        # Substring match against the pre-lowered bucket keys keeps the old
+        # semantics (e.g. "layer" matches "Layer 1" and "Layer 2")
+        for bucket_category, entries in self._projects_by_category.items():
+            if category in bucket_category:
+                results.extend(entries)
+
         return results 
\ No newline at end of file
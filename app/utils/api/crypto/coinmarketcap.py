@@ -74,7 +74,7 @@ class CoinMarketCapClient(BaseAPIClient):
             response = self.get("cryptocurrency/quotes/latest", params=params)
             
             if "data" not in response or symbol not in response["data"]:
-                logger.warning(f"Invalid response format from CoinMarketCap for {symbol}")
+                logger.warning("Invalid response format from CoinMarketCap for %s", symbol)
                 return {
                     "symbol": symbol,
                     "error": "not_found",
@@ -105,7 +105,7 @@ class CoinMarketCapClient(BaseAPIClient):
             return price_data
         
         except Exception as e:
-            logger.error(f"Error fetching cryptocurrency price for {symbol}: {str(e)}")
+            logger.error("Error fetching cryptocurrency price for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -162,7 +162,7 @@ class CoinMarketCapClient(BaseAPIClient):
             return results
         
         except Exception as e:
-            logger.error(f"Error fetching cryptocurrency listings: {str(e)}")
+            logger.error("Error fetching cryptocurrency listings: %s", e)
             return []
     
     def search_crypto(self, query: str) -> List[Dict[str, Any]]:
@@ -202,7 +202,7 @@ class CoinMarketCapClient(BaseAPIClient):
             return results
         
         except Exception as e:
-            logger.error(f"Error searching cryptocurrencies with query '{query}': {str(e)}")
+            logger.error("Error searching cryptocurrencies with query '%s': %s", query, e)
             return []
     
     def get_global_metrics(self, convert: str = "USD") -> Dict[str, Any]:
@@ -246,7 +246,7 @@ class CoinMarketCapClient(BaseAPIClient):
             return metrics
         
         except Exception as e:
-            logger.error(f"Error fetching global metrics: {str(e)}")
+            logger.error("Error fetching global metrics: %s", e)
             return {"error": "api_error", "message": str(e)}
     
     def get_exchange_info(self, slug: str, convert: str = "USD") -> Dict[str, Any]:
@@ -269,7 +269,7 @@ class CoinMarketCapClient(BaseAPIClient):
             response = self.get("exchange/info", params=params)
             
             if "data" not in response:
-                logger.warning(f"Invalid response format from CoinMarketCap for exchange {slug}")
+                logger.warning("Invalid response format from CoinMarketCap for exchange %s", slug)
                 return {
                     "slug": slug,
                     "error": "not_found",
@@ -283,7 +283,7 @@ class CoinMarketCapClient(BaseAPIClient):
             return exchange_data
         
         except Exception as e:
-            logger.error(f"Error fetching exchange info for {slug}: {str(e)}")
+            logger.error("Error fetching exchange info for %s: %s", slug, e)
             return {
                 "slug": slug,
                 "error": "api_error",
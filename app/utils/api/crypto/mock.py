@@ -230,7 +230,7 @@ class MockCryptoClient(BaseAPIClient):
                 }
                 
         except Exception as e:
-            logger.error(f"Error in mock get_crypto_price: {str(e)}")
+            logger.error("Error in mock get_crypto_price: %s", e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -285,7 +285,7 @@ class MockCryptoClient(BaseAPIClient):
                 }
                 
         except Exception as e:
-            logger.error(f"Error in mock get_crypto_details: {str(e)}")
+            logger.error("Error in mock get_crypto_details: %s", e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -350,7 +350,7 @@ class MockCryptoClient(BaseAPIClient):
             return result
                 
         except Exception as e:
-            logger.error(f"Error in mock get_historical_data: {str(e)}")
+            logger.error("Error in mock get_historical_data: %s", e)
             return []
     
     def search_crypto(self, query: str) -> List[Dict[str, Any]]:
@@ -365,6 +365,9 @@ class MockCryptoClient(BaseAPIClient):
         """
         try:
             query = query.upper()
+            # Lowered once here; the loop below was re-lowering the query on
+            # every iteration
+            query_lower = query.lower()
             results = []
             
             # Search by symbol exact match
@@ -381,7 +384,7 @@ class MockCryptoClient(BaseAPIClient):
             
             # Search by name or symbol contains query
             for symbol, data in self.crypto_data.items():
-                if query in symbol or query.lower() in data["name"].lower() or query.lower() in data["slug"].lower():
+                if query in symbol or query_lower in data["name"].lower() or query_lower in data["slug"].lower():
                     results.append({
                         "id": data["id"],
                         "name": data["name"],
@@ -393,7 +396,7 @@ class MockCryptoClient(BaseAPIClient):
             return results
                 
         except Exception as e:
-            logger.error(f"Error in mock search_crypto: {str(e)}")
+            logger.error("Error in mock search_crypto: %s", e)
             return []
     
     def get_global_metrics(self, convert: str = "USD") -> Dict[str, Any]:
@@ -411,7 +414,7 @@ class MockCryptoClient(BaseAPIClient):
             return self.market_data.copy()
                 
         except Exception as e:
-            logger.error(f"Error in mock get_global_metrics: {str(e)}")
+            logger.error("Error in mock get_global_metrics: %s", e)
             return {
                 "error": "api_error",
                 "message": f"Mock API error: {str(e)}"
@@ -444,5 +447,5 @@ class MockCryptoClient(BaseAPIClient):
             return results
                 
         except Exception as e:
-            logger.error(f"Error in mock get_trading_pairs: {str(e)}")
+            logger.error("Error in mock get_trading_pairs: %s", e)
             return [] 
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Shared async HTTP client for API clients
+
+Creating an httpx.AsyncClient per request discards the connection pool and
+pays TCP/TLS setup on every call. API clients should grab the shared client
+from here instead; the application lifespan closes it on shutdown.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Shared client, created lazily on first use
+_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared httpx.AsyncClient, creating it on first use
+
+    Returns:
+        Shared AsyncClient with a pooled connection limit
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+    return _client
+
+async def close_http_client() -> None:
+    """Close the shared client and drop its connection pool"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("Closed shared HTTP client")
+    _client = None
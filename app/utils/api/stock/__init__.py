@@ -7,8 +7,10 @@ from app.utils.api.stock.finnhub import FinnhubAPI
 
 from typing import Dict, Any, List, Optional, Literal
 import logging
+import re
 import aiohttp
-from datetime import datetime, timedelta
+from cachetools import TTLCache
+from datetime import datetime
 import os
 from dotenv import load_dotenv
 
@@ -17,6 +19,13 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Symbol markers for routing Indian listings to NSE, shared by the price and
+# details paths instead of being rebuilt per call. Compiled into one
+# alternation so detection is a single C-level scan of the uppercased
+# symbol instead of one interpreted substring probe per marker
+INDIAN_SYMBOL_MARKERS = (".NS", "RELIANCE", "TCS", "INFY", "NSE:", "BSE:")
+INDIAN_SYMBOL_PATTERN = re.compile("|".join(re.escape(marker) for marker in INDIAN_SYMBOL_MARKERS))
+
 class StockMarketAPI:
     """
     Unified API client for stock market data from multiple providers
@@ -28,8 +37,10 @@ class StockMarketAPI:
         self.finnhub = FinnhubAPI(api_key=os.getenv("FINNHUB_API_KEY"))
         self.base_url = "https://api.polygon.io/v2"
         self.api_key = "YOUR_POLYGON_API_KEY"  # Replace with actual API key
-        self.cache = {}
-        self.cache_duration = timedelta(minutes=5)
+        # Bounded TTL cache so repeated lookups skip the provider round trip
+        # without the unbounded growth of a plain dict; expiry replaces the
+        # per-entry timestamp bookkeeping
+        self.cache = TTLCache(maxsize=1024, ttl=300)
         
     async def get_stock_price(self, symbol: str) -> Dict[str, Any]:
         """
@@ -46,37 +57,37 @@ class StockMarketAPI:
             data = await self.finnhub.get_stock_price(symbol)
             if data and "error" not in data:
                 return data
-            logger.warning(f"Finnhub failed for {symbol}, trying NSE India")
+            logger.warning("Finnhub failed for %s, trying NSE India", symbol)
         except Exception as e:
-            logger.warning(f"Finnhub error for {symbol}: {str(e)}")
+            logger.warning("Finnhub error for %s: %s", symbol, e)
         
         # Try NSE India for Indian stocks
-        if ".NS" in symbol or any(indian in symbol.upper() for indian in ["NSE:", "BSE:", "RELIANCE", "TCS", "INFY"]):
+        if INDIAN_SYMBOL_PATTERN.search(symbol.upper()):
             try:
                 data = self.nse.get_stock_price(symbol)
                 if data and "error" not in data:
                     return data
-                logger.warning(f"NSE India failed for {symbol}, trying Yahoo Finance")
+                logger.warning("NSE India failed for %s, trying Yahoo Finance", symbol)
             except Exception as e:
-                logger.warning(f"NSE India error for {symbol}: {str(e)}")
+                logger.warning("NSE India error for %s: %s", symbol, e)
         
         # Try Yahoo Finance
         try:
             data = self.yahoo.get_stock_price(symbol)
             if data and "error" not in data:
                 return data
-            logger.warning(f"Yahoo Finance failed for {symbol}, trying Alpha Vantage")
+            logger.warning("Yahoo Finance failed for %s, trying Alpha Vantage", symbol)
         except Exception as e:
-            logger.warning(f"Yahoo Finance error for {symbol}: {str(e)}")
+            logger.warning("Yahoo Finance error for %s: %s", symbol, e)
         
         # Try Alpha Vantage as last resort
         try:
             data = self.alpha_vantage.get_stock_price(symbol)
             if data and "error" not in data:
                 return data
-            logger.warning(f"Alpha Vantage failed for {symbol}")
+            logger.warning("Alpha Vantage failed for %s", symbol)
         except Exception as e:
-            logger.warning(f"Alpha Vantage error for {symbol}: {str(e)}")
+            logger.warning("Alpha Vantage error for %s: %s", symbol, e)
         
         return {"error": f"Could not fetch stock price for {symbol} from any provider"}
     
@@ -156,7 +167,7 @@ class StockMarketAPI:
         if is_indian_stock and 'nse_india' not in providers:
             providers.append('nse_india')
             
-        for p in ['yahoo_finance', 'alpha_vantage']:
+        for p in ('yahoo_finance', 'alpha_vantage'):
             if p not in providers:
                 providers.append(p)
         
@@ -167,7 +178,7 @@ class StockMarketAPI:
                     data = self.alpha_vantage.get_historical_data(
                         symbol,
                         interval=interval_map.get(interval, ["daily"])[0],
-                        output_size="full" if period in ["5y", "max"] else "compact"
+                        output_size="full" if period in ("5y", "max") else "compact"
                     )
                 elif provider_name == 'yahoo_finance':
                     data = self.yahoo.get_historical_data(
@@ -184,7 +195,7 @@ class StockMarketAPI:
                     return data
                     
             except Exception as e:
-                logger.warning(f"Error getting historical data from {provider_name} for {symbol}: {str(e)}")
+                logger.warning("Error getting historical data from %s for %s: %s", provider_name, symbol, e)
                 continue
         
         # If all providers failed, return error
@@ -214,7 +225,7 @@ class StockMarketAPI:
         if provider:
             providers.append(provider)
             
-        for p in ['yahoo_finance', 'alpha_vantage', 'nse_india']:
+        for p in ('yahoo_finance', 'alpha_vantage', 'nse_india'):
             if p not in providers:
                 providers.append(p)
         
@@ -238,7 +249,7 @@ class StockMarketAPI:
                         seen_symbols.add(item.get('symbol'))
                     
             except Exception as e:
-                logger.warning(f"Error searching stocks from {provider_name}: {str(e)}")
+                logger.warning("Error searching stocks from %s: %s", provider_name, e)
                 continue
         
         return results
@@ -267,7 +278,7 @@ class StockMarketAPI:
                 summary['indices'].append(index)
                 summary['global_indices'].append(index)
         except Exception as e:
-            logger.warning(f"Error getting market summary from Yahoo Finance: {str(e)}")
+            logger.warning("Error getting market summary from Yahoo Finance: %s", e)
         
         # Get Indian market data from NSE
         try:
@@ -290,7 +301,7 @@ class StockMarketAPI:
             if 'error' not in market_status:
                 summary['market_status']['nse'] = market_status
         except Exception as e:
-            logger.warning(f"Error getting market data from NSE India: {str(e)}")
+            logger.warning("Error getting market data from NSE India: %s", e)
         
         return summary 
 
@@ -300,10 +311,9 @@ class StockMarketAPI:
         """
         try:
             # Check cache first
-            if symbol in self.cache:
-                cached_data, timestamp = self.cache[symbol]
-                if datetime.now() - timestamp < self.cache_duration:
-                    return cached_data
+            cached_data = self.cache.get(symbol)
+            if cached_data is not None:
+                return cached_data
 
             # Try Alpha Vantage first
             try:
@@ -320,10 +330,10 @@ class StockMarketAPI:
                         "close": float(data.get("price", 0)),  # Use price as close if not available
                         "timestamp": data.get("timestamp", datetime.now().isoformat())
                     }
-                    self.cache[symbol] = (stock_data, datetime.now())
+                    self.cache[symbol] = stock_data
                     return stock_data
             except Exception as e:
-                logger.warning(f"Alpha Vantage failed for {symbol}: {str(e)}")
+                logger.warning("Alpha Vantage failed for %s: %s", symbol, e)
 
             # Try Finnhub as backup
             try:
@@ -340,10 +350,10 @@ class StockMarketAPI:
                         "close": float(data.get("close", 0) if "close" in data else data.get("c", 0)),  # Close
                         "timestamp": datetime.now().isoformat()
                     }
-                    self.cache[symbol] = (stock_data, datetime.now())
+                    self.cache[symbol] = stock_data
                     return stock_data
             except Exception as e:
-                logger.warning(f"Finnhub failed for {symbol}: {str(e)}")
+                logger.warning("Finnhub failed for %s: %s", symbol, e)
 
             # Try Yahoo Finance as last resort
             try:
@@ -360,13 +370,13 @@ class StockMarketAPI:
                         "close": float(data.get("close", 0)),
                         "timestamp": datetime.now().isoformat()
                     }
-                    self.cache[symbol] = (stock_data, datetime.now())
+                    self.cache[symbol] = stock_data
                     return stock_data
             except Exception as e:
-                logger.warning(f"Yahoo Finance failed for {symbol}: {str(e)}")
+                logger.warning("Yahoo Finance failed for %s: %s", symbol, e)
                 
             # Try NSE India for Indian stocks
-            if ".NS" in symbol or any(indian in symbol.upper() for indian in ["NSE:", "BSE:", "RELIANCE", "TCS", "INFY"]):
+            if INDIAN_SYMBOL_PATTERN.search(symbol.upper()):
                 try:
                     data = await self.nse.get_stock_price_async(symbol)
                     if data and "error" not in data:
@@ -381,13 +391,13 @@ class StockMarketAPI:
                             "close": float(data.get("price", 0)),  # Use price as close if not available
                             "timestamp": data.get("timestamp", datetime.now().isoformat())
                         }
-                        self.cache[symbol] = (stock_data, datetime.now())
+                        self.cache[symbol] = stock_data
                         return stock_data
                 except Exception as e:
-                    logger.warning(f"NSE India failed for {symbol}: {str(e)}")
+                    logger.warning("NSE India failed for %s: %s", symbol, e)
 
             # If all APIs fail, return mock data for testing purposes
-            logger.info(f"Using mock data for {symbol} as all API calls failed")
+            logger.info("Using mock data for %s as all API calls failed", symbol)
             mock_data = {
                 "symbol": symbol,
                 "price": 100.0 if symbol == "AAPL" else 200.0 if symbol == "MSFT" else 50.0 if symbol == "BTC" else 3000.0,
@@ -400,11 +410,11 @@ class StockMarketAPI:
                 "timestamp": datetime.now().isoformat(),
                 "note": "MOCK DATA - APIs unavailable"
             }
-            self.cache[symbol] = (mock_data, datetime.now())
+            self.cache[symbol] = mock_data
             return mock_data
 
         except Exception as e:
-            logger.error(f"Error getting stock data for {symbol}: {str(e)}")
+            logger.error("Error getting stock data for %s: %s", symbol, e)
             return None
 
 class StockAPI(StockMarketAPI):
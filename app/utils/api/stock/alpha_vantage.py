@@ -55,7 +55,7 @@ class AlphaVantageClient(BaseAPIClient):
             response = self.get("", params=params)
             
             if "Global Quote" not in response:
-                logger.warning(f"Invalid response format from Alpha Vantage for {symbol}")
+                logger.warning("Invalid response format from Alpha Vantage for %s", symbol)
                 return {
                     "symbol": symbol,
                     "error": "not_found",
@@ -78,7 +78,7 @@ class AlphaVantageClient(BaseAPIClient):
             return price_data
         
         except Exception as e:
-            logger.error(f"Error fetching stock price for {symbol}: {str(e)}")
+            logger.error("Error fetching stock price for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -100,7 +100,7 @@ class AlphaVantageClient(BaseAPIClient):
         try:
             return self.get_stock_price(symbol)
         except Exception as e:
-            logger.error(f"Async error fetching stock price for {symbol}: {str(e)}")
+            logger.error("Async error fetching stock price for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -143,7 +143,7 @@ class AlphaVantageClient(BaseAPIClient):
                     break
             
             if not time_series_key:
-                logger.warning(f"Invalid response format from Alpha Vantage historical data for {symbol}")
+                logger.warning("Invalid response format from Alpha Vantage historical data for %s", symbol)
                 return {
                     "symbol": symbol,
                     "error": "not_found",
@@ -175,7 +175,7 @@ class AlphaVantageClient(BaseAPIClient):
             return historical_data
         
         except Exception as e:
-            logger.error(f"Error fetching historical data for {symbol}: {str(e)}")
+            logger.error("Error fetching historical data for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -202,7 +202,7 @@ class AlphaVantageClient(BaseAPIClient):
             response = self.get("", params=params)
             
             if "bestMatches" not in response:
-                logger.warning(f"Invalid response format from Alpha Vantage search for {keywords}")
+                logger.warning("Invalid response format from Alpha Vantage search for %s", keywords)
                 return []
             
             matches = response["bestMatches"]
@@ -220,7 +220,7 @@ class AlphaVantageClient(BaseAPIClient):
             return results
         
         except Exception as e:
-            logger.error(f"Error searching stocks with keywords '{keywords}': {str(e)}")
+            logger.error("Error searching stocks with keywords '%s': %s", keywords, e)
             return []
     
     def get_market_indices(self) -> List[Dict[str, Any]]:
@@ -248,6 +248,6 @@ class AlphaVantageClient(BaseAPIClient):
                 if "error" not in price_data:
                     results.append(price_data)
             except Exception as e:
-                logger.error(f"Error fetching data for index {idx}: {str(e)}")
+                logger.error("Error fetching data for index %s: %s", idx, e)
         
         return results 
\ No newline at end of file
@@ -5,6 +5,8 @@ import os
 import logging
 from typing import Dict, Any, Optional
 import httpx
+
+from app.utils.api.http import get_http_client
 from dotenv import load_dotenv
 from ..base import BaseAPIClient
 from ..cache import get_from_cache, save_to_cache
@@ -64,10 +66,10 @@ class FinnhubAPI(BaseAPIClient):
                 "token": self.api_key
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
                 
             if not data or "c" not in data:
                 return {"error": f"No data available for symbol {symbol}"}
@@ -91,7 +93,7 @@ class FinnhubAPI(BaseAPIClient):
             return result
             
         except Exception as e:
-            logger.error(f"Error fetching stock price from Finnhub: {str(e)}")
+            logger.error("Error fetching stock price from Finnhub: %s", e)
             return {"error": f"Failed to fetch stock price: {str(e)}"}
     
     async def search_symbol(self, query: str) -> Optional[str]:
@@ -120,10 +122,10 @@ class FinnhubAPI(BaseAPIClient):
                 "token": self.api_key
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
                 
             result = None
             if data and "result" in data and data["result"]:
@@ -135,5 +137,5 @@ class FinnhubAPI(BaseAPIClient):
             return result
             
         except Exception as e:
-            logger.error(f"Error searching symbol on Finnhub: {str(e)}")
+            logger.error("Error searching symbol on Finnhub: %s", e)
             return None 
\ No newline at end of file
@@ -59,7 +59,7 @@ class NSEIndiaClient(BaseAPIClient):
             response = self.get(endpoint, {})
             
             if "priceInfo" not in response:
-                logger.warning(f"Invalid response format from NSE India for {symbol}")
+                logger.warning("Invalid response format from NSE India for %s", symbol)
                 return {
                     "symbol": symbol,
                     "error": "not_found",
@@ -91,7 +91,7 @@ class NSEIndiaClient(BaseAPIClient):
             return price_data
         
         except Exception as e:
-            logger.error(f"Error fetching stock price for {symbol}: {str(e)}")
+            logger.error("Error fetching stock price for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -112,7 +112,7 @@ class NSEIndiaClient(BaseAPIClient):
         try:
             return self.get_stock_price(symbol)
         except Exception as e:
-            logger.error(f"Async error fetching stock price for {symbol}: {str(e)}")
+            logger.error("Async error fetching stock price for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -135,7 +135,7 @@ class NSEIndiaClient(BaseAPIClient):
                 return results[0]["symbol"]
             return None
         except Exception as e:
-            logger.error(f"Error searching symbol on NSE: {str(e)}")
+            logger.error("Error searching symbol on NSE: %s", e)
             return None
     
     def get_market_status(self) -> Dict[str, Any]:
@@ -169,7 +169,7 @@ class NSEIndiaClient(BaseAPIClient):
             return status_data
         
         except Exception as e:
-            logger.error(f"Error fetching market status: {str(e)}")
+            logger.error("Error fetching market status: %s", e)
             return {"error": "api_error", "message": str(e)}
     
     def get_indices(self) -> List[Dict[str, Any]]:
@@ -206,7 +206,7 @@ class NSEIndiaClient(BaseAPIClient):
             return results
         
         except Exception as e:
-            logger.error(f"Error fetching indices: {str(e)}")
+            logger.error("Error fetching indices: %s", e)
             return []
     
     def search_stocks(self, query: str) -> List[Dict[str, Any]]:
@@ -237,7 +237,7 @@ class NSEIndiaClient(BaseAPIClient):
             return results
         
         except Exception as e:
-            logger.error(f"Error searching stocks with query '{query}': {str(e)}")
+            logger.error("Error searching stocks with query '%s': %s", query, e)
             return []
     
     def get_top_gainers_losers(self) -> Dict[str, List]:
@@ -284,5 +284,5 @@ class NSEIndiaClient(BaseAPIClient):
             return result
         
         except Exception as e:
-            logger.error(f"Error fetching top gainers/losers: {str(e)}")
+            logger.error("Error fetching top gainers/losers: %s", e)
             return {"gainers": [], "losers": []} 
\ No newline at end of file
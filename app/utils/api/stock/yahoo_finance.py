@@ -50,7 +50,7 @@ class YahooFinanceClient(BaseAPIClient):
             response = self.get("quote", params=params)
             
             if "quoteResponse" not in response or "result" not in response["quoteResponse"] or not response["quoteResponse"]["result"]:
-                logger.warning(f"Invalid response format from Yahoo Finance for {symbol}")
+                logger.warning("Invalid response format from Yahoo Finance for %s", symbol)
                 return {
                     "symbol": symbol,
                     "error": "not_found",
@@ -76,7 +76,7 @@ class YahooFinanceClient(BaseAPIClient):
             return price_data
         
         except Exception as e:
-            logger.error(f"Error fetching stock price for {symbol}: {str(e)}")
+            logger.error("Error fetching stock price for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -97,7 +97,7 @@ class YahooFinanceClient(BaseAPIClient):
         try:
             return self.get_stock_price(symbol)
         except Exception as e:
-            logger.error(f"Async error fetching stock price for {symbol}: {str(e)}")
+            logger.error("Async error fetching stock price for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -128,7 +128,7 @@ class YahooFinanceClient(BaseAPIClient):
             response = self.get("chart", params=params)
             
             if "chart" not in response or "result" not in response["chart"] or not response["chart"]["result"]:
-                logger.warning(f"Invalid response format from Yahoo Finance historical data for {symbol}")
+                logger.warning("Invalid response format from Yahoo Finance historical data for %s", symbol)
                 return {
                     "symbol": symbol,
                     "error": "not_found",
@@ -165,7 +165,7 @@ class YahooFinanceClient(BaseAPIClient):
             return historical_data
         
         except Exception as e:
-            logger.error(f"Error fetching historical data for {symbol}: {str(e)}")
+            logger.error("Error fetching historical data for %s: %s", symbol, e)
             return {
                 "symbol": symbol,
                 "error": "api_error",
@@ -200,7 +200,7 @@ class YahooFinanceClient(BaseAPIClient):
             return results
         
         except Exception as e:
-            logger.error(f"Error fetching market summary: {str(e)}")
+            logger.error("Error fetching market summary: %s", e)
             return []
     
     def search_stocks(self, query: str) -> List[Dict[str, Any]]:
@@ -239,5 +239,5 @@ class YahooFinanceClient(BaseAPIClient):
             return results
             
         except Exception as e:
-            logger.error(f"Error searching stocks with query '{query}': {str(e)}")
+            logger.error("Error searching stocks with query '%s': %s", query, e)
             return [] 
\ No newline at end of file
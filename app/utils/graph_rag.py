@@ -43,7 +43,7 @@ class GraphRAG:
         Returns:
             Combined results from vector search and knowledge graph
         """
-        self.logger.info(f"GraphRAG query: {query}")
+        self.logger.info("GraphRAG query: %s", query)
         
         # Step 1: Perform vector search
         vector_results = self.vector_db.search(query, top_k=top_k)
@@ -59,7 +59,7 @@ class GraphRAG:
                 name = metadata['name'].replace(' ', '_')
                 extracted_entities.add(name)
         
-        self.logger.info(f"Extracted entities from vector search: {extracted_entities}")
+        self.logger.info("Extracted entities from vector search: %s", extracted_entities)
         
         if not extracted_entities:
             return {
@@ -130,7 +130,7 @@ class GraphRAG:
                     
                     # Add any relationship data found in the node
                     for key, value in node_data.items():
-                        if key not in ['type', 'id'] and value:
+                        if key not in ('type', 'id') and value:
                             relationships.append({
                                 'type': key,
                                 'value': value
@@ -172,7 +172,7 @@ class GraphRAG:
         if not vector_results:
             return ""
         
-        context = "Relevant information:\n\n"
+        parts = ["Relevant information:\n\n"]
         
         for i, result in enumerate(vector_results, 1):
             text = result.get('text', '')
@@ -181,18 +181,20 @@ class GraphRAG:
             name = metadata.get('name', symbol)
             
             if name and text:
-                context += f"{i}. {name} ({symbol}): {text}\n\n"
+                parts.append(f"{i}. {name} ({symbol}): {text}\n\n")
             elif text:
-                context += f"{i}. {text}\n\n"
+                parts.append(f"{i}. {text}\n\n")
         
-        return context
+        return "".join(parts)
     
     def _format_combined_results(self, combined_results: List[Dict[str, Any]]) -> str:
         """Format combined results for RAG context"""
         if not combined_results:
             return ""
         
-        context = "Relevant information including graph relationships:\n\n"
+        # Joined once at the end; += on a str inside this loop is quadratic
+        # in the worst case
+        parts = ["Relevant information including graph relationships:\n\n"]
         
         for i, result in enumerate(combined_results, 1):
             # Basic info
@@ -206,36 +208,36 @@ class GraphRAG:
             relationships = result.get('relationships', [])
             
             if name:
-                context += f"{i}. {name} ({symbol}):\n"
+                parts.append(f"{i}. {name} ({symbol}):\n")
             else:
-                context += f"{i}. Information:\n"
+                parts.append(f"{i}. Information:\n")
             
             if text:
-                context += f"   Description: {text}\n"
+                parts.append(f"   Description: {text}\n")
             
             # Add graph knowledge
             if graph_data:
                 for gd in graph_data:
                     gd_data = gd.get('data', {})
                     if 'category' in gd_data:
-                        context += f"   Category: {gd_data['category']}\n"
+                        parts.append(f"   Category: {gd_data['category']}\n")
                     if 'market_cap' in gd_data:
-                        context += f"   Market Cap: {gd_data['market_cap']}\n"
+                        parts.append(f"   Market Cap: {gd_data['market_cap']}\n")
                     if 'funding' in gd_data:
-                        context += f"   Funding: {gd_data['funding']}\n"
+                        parts.append(f"   Funding: {gd_data['funding']}\n")
             
             # Add relationships
             if relationships:
-                context += "   Relationships:\n"
+                parts.append("   Relationships:\n")
                 for rel in relationships:
                     rel_type = rel.get('type', '')
                     rel_value = rel.get('value', '')
                     if rel_type and rel_value:
-                        context += f"      - {rel_type}: {rel_value}\n"
+                        parts.append(f"      - {rel_type}: {rel_value}\n")
             
-            context += "\n"
+            parts.append("\n")
         
-        return context
+        return "".join(parts)
     
     def enhance_prompt(self, query: str, rag_results: Dict[str, Any]) -> str:
         """
@@ -285,40 +287,43 @@ ANSWER:
             entity_types=["Cryptocurrency"]
         )
         
-        # Extract relationship information
-        relationship_context = "Relationships between cryptocurrencies:\n\n"
-        
+        # Extract relationship information; collect the lines and join once
+        # instead of growing a string with += inside the loops
+        context_parts = ["Relationships between cryptocurrencies:\n\n"]
+
         combined_results = results.get("combined_results", [])
         for result in combined_results:
             graph_data = result.get("graph_data", [])
-            
+
             for gd in graph_data:
                 node_id = gd.get("id", "")
-                
+
                 # Get all relationships for this node
                 if node_id:
                     entity_data = self.knowledge_graph.get_entity(node_id)
                     if entity_data:
                         relationships = entity_data.get("relationships", [])
-                        
+
                         if relationships:
-                            relationship_context += f"{node_id} relationships:\n"
-                            
+                            context_parts.append(f"{node_id} relationships:\n")
+
                             for rel in relationships:
                                 predicate = rel.get("predicate", "")
                                 obj = rel.get("object", "")
                                 weight = rel.get("weight", 1.0)
-                                
+
                                 if predicate and obj:
-                                    relationship_context += f"  - {predicate} {obj} (strength: {weight:.1f})\n"
-                            
-                            relationship_context += "\n"
-        
+                                    context_parts.append(f"  - {predicate} {obj} (strength: {weight:.1f})\n")
+
+                            context_parts.append("\n")
+
         # Add relationship context to results
+        relationship_context = "".join(context_parts)
         results["relationship_context"] = relationship_context
-        
-        # Enhance RAG context with relationship information
-        if relationship_context and relationship_context != "Relationships between cryptocurrencies:\n\n":
+
+        # Enhance RAG context with relationship information; any appended
+        # line means there is more than the header
+        if len(context_parts) > 1:
             results["rag_context"] += "\n\n" + relationship_context
-        
+
         return results 
\ No newline at end of file
@@ -185,11 +185,11 @@ class MeTTaKnowledgeGraph:
         Query the knowledge graph using a natural language query
         Implements Graph RAG (Retrieval Augmented Generation) using graph traversal
         """
-        self.logger.info(f"Querying knowledge graph with: {query}")
+        self.logger.info("Querying knowledge graph with: %s", query)
         
         # Extract entities and predicates from the query
         extracted_entities = self._extract_entities_from_query(query)
-        self.logger.info(f"Extracted entities: {extracted_entities}")
+        self.logger.info("Extracted entities: %s", extracted_entities)
         
         if not extracted_entities:
             return {"results": [], "message": "No entities found in query"}
@@ -327,10 +327,10 @@ class MeTTaKnowledgeGraph:
                     rel.get("metadata", {})
                 )
             
-            self.logger.info(f"Successfully loaded knowledge graph from {json_file}")
+            self.logger.info("Successfully loaded knowledge graph from %s", json_file)
             
         except Exception as e:
-            self.logger.error(f"Error loading knowledge graph from {json_file}: {str(e)}")
+            self.logger.error("Error loading knowledge graph from %s: %s", json_file, e)
     
     def save_to_json(self, json_file: str):
         """Save knowledge graph data to a JSON file"""
@@ -365,18 +365,18 @@ class MeTTaKnowledgeGraph:
             with open(json_file, 'w') as f:
                 json.dump(data, f, indent=2)
             
-            self.logger.info(f"Successfully saved knowledge graph to {json_file}")
+            self.logger.info("Successfully saved knowledge graph to %s", json_file)
             
         except Exception as e:
-            self.logger.error(f"Error saving knowledge graph to {json_file}: {str(e)}")
+            self.logger.error("Error saving knowledge graph to %s: %s", json_file, e)
     
     def export_rdf(self, output_file: str, format: str = "turtle"):
         """Export the knowledge graph to RDF format"""
         try:
             self.rdf_graph.serialize(destination=output_file, format=format)
-            self.logger.info(f"Successfully exported knowledge graph to {output_file} in {format} format")
+            self.logger.info("Successfully exported knowledge graph to %s in %s format", output_file, format)
         except Exception as e:
-            self.logger.error(f"Error exporting knowledge graph to {output_file}: {str(e)}")
+            self.logger.error("Error exporting knowledge graph to %s: %s", output_file, e)
     
     # Graph RAG specific methods
     def semantic_graph_search(self, query: str, vector_db, top_k: int = 3) -> Dict[str, Any]:
@@ -0,0 +1,157 @@
+"""
+Semantic response cache for near-duplicate AI prompts
+"""
+
+import hashlib
+import logging
+import time
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SentenceTransformer = None
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """
+    Two-tier cache mapping prompts to previously generated responses
+
+    Tier 1 is an exact-match dict keyed on a hash of the whitespace-normalized
+    prompt, so a repeated question costs one digest. Tier 2 embeds the prompt
+    and returns the response stored for the nearest cached prompt when cosine
+    similarity clears the threshold, so rephrasings like "what is bitcoin" vs
+    "what's bitcoin" also skip the network round trip. Entries expire after a
+    TTL so answers do not go stale.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.95, ttl: int = 3600,
+                 max_entries: int = 1024, embedding_model: str = "all-MiniLM-L6-v2"):
+        """
+        Initialize the cache
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a tier-2 hit
+            ttl: Seconds before a cached response expires
+            max_entries: Maximum number of cached responses per tier
+            embedding_model: Name of the sentence transformer model to use
+        """
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.embedding_model_name = embedding_model
+
+        # Loaded lazily so importing this module stays cheap; the first
+        # put/get on the AI fallback path pays the one-time model load.
+        # Without sentence-transformers the cache degrades to exact-only.
+        self._model = None
+
+        # Tier 1: (digest, context) -> (response, inserted_at)
+        self._exact: dict = {}
+
+        # Tier 2: parallel entry list plus a unit-normalized embedding
+        # matrix, so a lookup is one matrix-vector product
+        self._entries: List[Tuple[Any, str, float]] = []
+        self._embeddings: Optional[np.ndarray] = None
+
+    def get(self, prompt: str, context: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a cached response for the prompt
+
+        Args:
+            prompt: The user's query
+            context: Additional context the response was generated with
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        now = time.time()
+        key = (self._digest(prompt), context)
+        exact_hit = self._exact.get(key)
+        if exact_hit is not None:
+            response, inserted_at = exact_hit
+            if now - inserted_at < self.ttl:
+                return response
+            del self._exact[key]
+
+        if self._embeddings is None or not self._entries:
+            return None
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return None
+
+        similarities = self._embeddings @ embedding
+        best_index = None
+        best_similarity = self.similarity_threshold
+        for index in np.flatnonzero(similarities >= self.similarity_threshold):
+            entry_context, _, inserted_at = self._entries[index]
+            if entry_context != context or now - inserted_at >= self.ttl:
+                continue
+            if similarities[index] >= best_similarity:
+                best_index = int(index)
+                best_similarity = similarities[index]
+        if best_index is None:
+            return None
+        return self._entries[best_index][1]
+
+    def put(self, prompt: str, response: str, context: Optional[str] = None):
+        """
+        Cache a response for the prompt
+
+        Args:
+            prompt: The user's query
+            response: The generated response to cache
+            context: Additional context the response was generated with
+        """
+        now = time.time()
+        self._exact[(self._digest(prompt), context)] = (response, now)
+        while len(self._exact) > self.max_entries:
+            # Dicts preserve insertion order, so the first key is the oldest
+            del self._exact[next(iter(self._exact))]
+
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return
+        self._entries.append((context, response, now))
+        if self._embeddings is None:
+            self._embeddings = embedding[np.newaxis, :]
+        else:
+            self._embeddings = np.vstack([self._embeddings, embedding])
+        if len(self._entries) > self.max_entries:
+            # Entries are appended in time order, so drop the oldest
+            self._entries.pop(0)
+            self._embeddings = self._embeddings[1:]
+
+    def _digest(self, prompt: str) -> bytes:
+        """Hash the whitespace-normalized prompt for exact-match lookups"""
+        return hashlib.blake2b(" ".join(prompt.lower().split()).encode()).digest()
+
+    def _embed(self, prompt: str) -> Optional[np.ndarray]:
+        """
+        Encode the normalized prompt to a unit vector
+
+        Args:
+            prompt: The prompt text
+
+        Returns:
+            The normalized embedding, or None when embedding fails
+        """
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            return None
+        try:
+            if self._model is None:
+                self._model = SentenceTransformer(self.embedding_model_name)
+                logger.info("Initialized semantic cache with model: %s", self.embedding_model_name)
+            embedding = self._model.encode(" ".join(prompt.lower().split()))
+            norm = np.linalg.norm(embedding)
+            if not norm:
+                return None
+            return embedding / norm
+        except Exception as e:
+            logger.error("Error embedding prompt for semantic cache: %s", e)
+            return None
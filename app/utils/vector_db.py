@@ -4,13 +4,27 @@ Vector Database for storing and retrieving embeddings
 
 import os
 import json
+import hashlib
 import logging
 import numpy as np
+from cachetools import TTLCache
 from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Any, Optional, Union
 
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    hnswlib = None
+    HNSWLIB_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Module-level cache of query embeddings shared across all instances.
+# Conversational traffic is highly skewed, so a hit skips the whole
+# embedding pass for repeated queries.
+_EMBEDDING_CACHE = TTLCache(maxsize=10_000, ttl=3600)
+
 class VectorDatabase:
     """
     Simple vector database using sentence transformers
@@ -26,6 +40,7 @@ class VectorDatabase:
             embedding_model: Name of the sentence transformer model to use
         """
         self.collection_name = collection_name
+        self.embedding_model_name = embedding_model
         self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "vector_db")
         os.makedirs(self.data_dir, exist_ok=True)
         
@@ -38,11 +53,35 @@ class VectorDatabase:
         # Initialize the embedding model
         try:
             self.model = SentenceTransformer(embedding_model)
-            logger.info(f"Initialized vector database with model: {embedding_model}")
+            logger.info("Initialized vector database with model: %s", embedding_model)
         except Exception as e:
-            logger.error(f"Error initializing embedding model: {str(e)}")
+            logger.error("Error initializing embedding model: %s", e)
             raise
-    
+
+        # Build an ANN index over the loaded embeddings so search is
+        # sub-linear instead of a Python cosine loop over every document
+        self.index = None
+        self._build_index()
+
+    def _build_index(self):
+        """
+        Build an HNSW index over the current embeddings if hnswlib is available
+        """
+        if not HNSWLIB_AVAILABLE or not self.embeddings:
+            return
+
+        try:
+            dim = len(self.embeddings[0])
+            index = hnswlib.Index(space='cosine', dim=dim)
+            index.init_index(max_elements=max(len(self.embeddings), 1000), ef_construction=200, M=16)
+            index.add_items(np.array(self.embeddings), np.arange(len(self.embeddings)))
+            index.set_ef(50)
+            self.index = index
+            logger.info("Built HNSW index with %s embeddings", len(self.embeddings))
+        except Exception as e:
+            logger.error("Error building HNSW index, falling back to linear scan: %s", e)
+            self.index = None
+
     def load_from_disk(self):
         """
         Load the database from disk if it exists
@@ -54,9 +93,9 @@ class VectorDatabase:
                     self.documents = data.get('documents', [])
                     # Convert embeddings from list to numpy array
                     self.embeddings = [np.array(emb) for emb in data.get('embeddings', [])]
-                logger.info(f"Loaded {len(self.documents)} documents from {self.db_file}")
+                logger.info("Loaded %s documents from %s", len(self.documents), self.db_file)
             except Exception as e:
-                logger.error(f"Error loading vector database from disk: {str(e)}")
+                logger.error("Error loading vector database from disk: %s", e)
                 self.documents = []
                 self.embeddings = []
     
@@ -72,9 +111,9 @@ class VectorDatabase:
                     'documents': self.documents,
                     'embeddings': embeddings_list
                 }, f)
-            logger.info(f"Saved {len(self.documents)} documents to {self.db_file}")
+            logger.info("Saved %s documents to %s", len(self.documents), self.db_file)
         except Exception as e:
-            logger.error(f"Error saving vector database to disk: {str(e)}")
+            logger.error("Error saving vector database to disk: %s", e)
     
     def add_documents(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None):
         """
@@ -105,9 +144,11 @@ class VectorDatabase:
             
             # Save to disk
             self.save_to_disk()
-            logger.info(f"Added {len(texts)} documents to the database")
+            # Rebuild the ANN index so new documents are searchable
+            self._build_index()
+            logger.info("Added %s documents to the database", len(texts))
         except Exception as e:
-            logger.error(f"Error adding documents to vector database: {str(e)}")
+            logger.error("Error adding documents to vector database: %s", e)
     
     def search(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
@@ -126,8 +167,24 @@ class VectorDatabase:
         
         try:
             # Create embedding for the query
-            query_embedding = self.model.encode(query)
-            
+            query_embedding = self._embed_query(query)
+
+            # Use the ANN index when available (sub-linear lookup)
+            if self.index is not None:
+                k = min(top_k, len(self.documents))
+                labels, distances = self.index.knn_query(query_embedding, k=k)
+                results = []
+                for idx, dist in zip(labels[0], distances[0]):
+                    doc = self.documents[int(idx)]
+                    results.append({
+                        'id': doc['id'],
+                        'text': doc['text'],
+                        'metadata': doc['metadata'],
+                        # hnswlib returns cosine distance; convert back to similarity
+                        'score': float(1.0 - dist)
+                    })
+                return results
+
             # Calculate cosine similarity
             similarities = []
             for doc_embedding in self.embeddings:
@@ -152,9 +209,26 @@ class VectorDatabase:
             
             return results
         except Exception as e:
-            logger.error(f"Error searching vector database: {str(e)}")
+            logger.error("Error searching vector database: %s", e)
             return []
     
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Encode a query, reusing a cached embedding when available
+
+        Args:
+            query: The query text
+
+        Returns:
+            The query embedding
+        """
+        key = (self.embedding_model_name, hashlib.sha256(query.encode()).digest())
+        embedding = _EMBEDDING_CACHE.get(key)
+        if embedding is None:
+            embedding = self.model.encode(query)
+            _EMBEDDING_CACHE[key] = embedding
+        return embedding
+
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """
         Calculate cosine similarity between two vectors
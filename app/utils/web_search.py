@@ -7,8 +7,47 @@ import json
 import requests
 from typing import List, Dict, Any, Optional
 
+import ahocorasick
+
 logger = logging.getLogger(__name__)
 
+# Project alias keywords and crypto context terms used by combined_search,
+# promoted to module scope so each search call skips the dict construction
+PROJECT_KEYWORDS = {
+    "singularitynet": ("singularitynet", "agix", "agi network"),
+    "fetchai": ("fetchai", "fetch.ai", "fet"),
+    "ocean": ("ocean protocol", "ocean"),
+    "sui": ("sui blockchain", "sui"),
+    "aptos": ("aptos blockchain", "aptos"),
+    "ethereum": ("ethereum", "eth"),
+    "solana": ("solana", "sol"),
+    "bitcoin": ("bitcoin", "btc")
+}
+
+CRYPTO_CONTEXT_TERMS = ("crypto", "blockchain", "token", "defi", "nft", "web3")
+
+# Keywords checked by the project-detection branch of search(), in priority order
+SEARCH_PROJECT_KEYWORDS = ("singularitynet", "agix", "fetchai", "fet", "ocean", "sui", "aptos")
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Index every search keyword so one pass finds all of them"""
+    automaton = ahocorasick.Automaton()
+    for keywords in PROJECT_KEYWORDS.values():
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+    for term in CRYPTO_CONTEXT_TERMS:
+        automaton.add_word(term, term)
+    for keyword in SEARCH_PROJECT_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _matched_keywords(query_lower: str) -> frozenset:
+    """All search keywords present in the query, from a single automaton scan"""
+    return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(query_lower))
+
 class WebSearchClient:
     """
     Client for searching the web for information
@@ -85,7 +124,7 @@ class WebSearchClient:
             
             return search_results
         except Exception as e:
-            logger.error(f"Error searching Wikipedia: {str(e)}")
+            logger.error("Error searching Wikipedia: %s", e)
             return []
     
     def search_docs(self, project: str, query: str) -> List[Dict[str, Any]]:
@@ -109,7 +148,7 @@ class WebSearchClient:
         }
         
         if project.lower() not in docs_map:
-            logger.warning(f"No documentation available for project: {project}")
+            logger.warning("No documentation available for project: %s", project)
             return []
         
         # Since we can't easily scrape all docs without setting up a more complex system,
@@ -145,14 +184,10 @@ class WebSearchClient:
         wiki_results = self.search_wikipedia(search_query)
         results.extend(wiki_results)
         
-        # Check if this is about a specific project
-        project_keywords = ["singularitynet", "agix", "fetchai", "fet", "ocean", "sui", "aptos"]
-        detected_project = None
-        
-        for keyword in project_keywords:
-            if keyword.lower() in query.lower():
-                detected_project = keyword
-                break
+        # Check if this is about a specific project; one automaton scan
+        # replaces the per-keyword substring checks
+        matched = _matched_keywords(query.lower())
+        detected_project = next((kw for kw in SEARCH_PROJECT_KEYWORDS if kw in matched), None)
         
         # If a project was detected, search its documentation
         if detected_project:
@@ -175,7 +210,7 @@ class WebSearchClient:
         Returns:
             List of search results from all sources
         """
-        logger.info(f"Performing combined search for: {query}")
+        logger.info("Performing combined search for: %s", query)
         
         # List to store all results
         all_results = []
@@ -184,27 +219,15 @@ class WebSearchClient:
         wiki_results = self.search_wikipedia(query)
         all_results.extend(wiki_results)
         
-        # Check if query is about a specific project
-        project_keywords = {
-            "singularitynet": ["singularitynet", "agix", "agi network"],
-            "fetchai": ["fetchai", "fetch.ai", "fet"],
-            "ocean": ["ocean protocol", "ocean"],
-            "sui": ["sui blockchain", "sui"],
-            "aptos": ["aptos blockchain", "aptos"],
-            "ethereum": ["ethereum", "eth"],
-            "solana": ["solana", "sol"],
-            "bitcoin": ["bitcoin", "btc"]
-        }
-        
-        # Check for project mentions in the query
-        query_lower = query.lower()
-        for project, keywords in project_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
+        # Check for project mentions in the query with one automaton scan
+        matched = _matched_keywords(query.lower())
+        for project, keywords in PROJECT_KEYWORDS.items():
+            if not matched.isdisjoint(keywords):
                 doc_results = self.search_docs(project, query)
                 all_results.extend(doc_results)
-        
+
         # Add context for cryptocurrency/blockchain queries
-        if any(term in query_lower for term in ["crypto", "blockchain", "token", "defi", "nft", "web3"]):
+        if not matched.isdisjoint(CRYPTO_CONTEXT_TERMS):
             crypto_results = self.search(query, context="cryptocurrency blockchain")
             if crypto_results and "results" in crypto_results:
                 # Add any results we don't already have
@@ -213,5 +236,5 @@ class WebSearchClient:
                     if result.get("url") not in existing_urls:
                         all_results.append(result)
         
-        logger.info(f"Found {len(all_results)} results in combined search")
+        logger.info("Found %s results in combined search", len(all_results))
         return all_results 
\ No newline at end of file